@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Compile central config and skill customizations into _bmad/config.bundle.
+
+The bundle is a pre-merged JSON snapshot that records the fingerprint of
+every source layer. The resolvers serve a bundled entry with one file read
+while its layers are unchanged. Any entry whose layers were edited falls
+back to the live TOML, so a stale bundle is never wrong, only slower.
+Re-run after editing config to restore the fast path.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Installed scripts are consumer files, not a location for interpreter caches.
+sys.dont_write_bytecode = True
+
+try:
+    from config_utils import ConfigError, compile_bundle, discover_skills, write_bundle
+except ModuleNotFoundError as error:
+    if error.name != "tomllib":
+        raise
+    sys.stderr.write("error: Python 3.11+ is required (stdlib `tomllib` not found).\n")
+    raise SystemExit(3) from None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile BMad config and skill customization into _bmad/config.bundle."
+    )
+    parser.add_argument(
+        "--project-root",
+        "-p",
+        required=True,
+        help="Absolute project root containing _bmad/",
+    )
+    parser.add_argument(
+        "--skill",
+        "-s",
+        action="append",
+        default=[],
+        help="Skill directory to include (repeatable)",
+    )
+    parser.add_argument(
+        "--skills-root",
+        action="append",
+        default=[],
+        help="Include every skill with a customize.toml under this directory (repeatable)",
+    )
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    if not (project_root / "_bmad").is_dir():
+        sys.stderr.write(f"error: project root does not contain _bmad/: {project_root}\n")
+        return 1
+    skill_dirs = [Path(skill).resolve() for skill in args.skill]
+
+    try:
+        for skills_root in args.skills_root:
+            skill_dirs.extend(discover_skills(Path(skills_root).resolve()))
+        bundle = compile_bundle(project_root, dict.fromkeys(skill_dirs))
+        path = write_bundle(project_root, bundle)
+    except ConfigError as error:
+        sys.stderr.write(f"error: {error}\n")
+        return 1
+
+    sys.stdout.write(f"compiled {len(bundle['skills'])} skills into {path}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import datetime
+import hashlib
+import json
+import os
+import queue
+import stat as stat_module
+import threading
+import time
 import tomllib
+from itertools import repeat
+from operator import contains, itemgetter
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 
 class ConfigError(ValueError):
@@ -13,43 +23,273 @@ class ConfigError(ValueError):
 
 _KEYED_MERGE_FIELDS = ("code", "id")
 
+_CACHE_VERSION = 2
+_BUNDLE_FORMAT = 2
+# Filesystems with coarse timestamps can hide a same-size edit made right
+# after a cache write; entries that close to the source mtime are re-hashed.
+_RACY_WINDOW_NS = 2_000_000_000
 
-def load_toml(path: Path, *, required: bool = False) -> dict[str, Any]:
-    """Load a TOML table, allowing absence only for optional layers."""
-    if not path.exists():
-        if required:
-            raise ConfigError(f"required TOML file not found: {path}")
-        return {}
-    if not path.is_file():
-        raise ConfigError(f"TOML layer is not a file: {path}")
+
+def cache_dir_for(project_root: Path) -> Path:
+    return project_root / "_bmad" / ".cache"
+
+
+def ensure_cache_dir(cache_dir: Path) -> None:
+    """Create the cache directory, ignored by git, under an existing _bmad/."""
+    if not cache_dir.is_dir():
+        cache_dir.mkdir(exist_ok=True)
+        (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+# Cache records are JSON, never pickle: `_bmad/.cache/` lives inside a checkout, so
+# reading one must not be able to run code. TOML's date and time values become one-key
+# tagged objects, and real keys starting with "$" gain another "$" so tags stay unambiguous.
+_TIME_TAGS: dict[str, Callable[[str], Any]] = {
+    "$datetime": datetime.datetime.fromisoformat,
+    "$date": datetime.date.fromisoformat,
+    "$time": datetime.time.fromisoformat,
+}
+
+
+def _encode_cached(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            (f"${key}" if key.startswith("$") else key): _encode_cached(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_encode_cached(item) for item in value]
+    if isinstance(value, datetime.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"$time": value.isoformat()}
+    return value
+
+
+def _decode_cached(table: dict[str, Any]) -> Any:
+    if len(table) == 1:
+        ((key, value),) = table.items()
+        if key in _TIME_TAGS:
+            return _TIME_TAGS[key](value)
+    if any(key.startswith("$") for key in table):
+        return {(key[1:] if key.startswith("$") else key): item for key, item in table.items()}
+    return table
+
+
+def _read_cache(cache_path: Path) -> Any:
+    """Return a cached record, or None when absent, unreadable, or stale-format."""
+    try:
+        raw = cache_path.read_bytes()
+        # Tags and escaped keys all start with "$"; most records hold neither.
+        record = json.loads(raw, object_hook=_decode_cached if b'"$' in raw else None)
+    except Exception:  # a cache is disposable; any damage is just a miss
+        return None
+    if not isinstance(record, dict) or record.get("version") != _CACHE_VERSION:
+        return None
+    return record
+
+
+def _write_cache(cache_path: Path, record: dict[str, Any]) -> None:
+    """Publish a cache record atomically; an unwritable cache is silently skipped."""
+    record = {"version": _CACHE_VERSION, "written_ns": time.time_ns(), **record}
+    try:
+        ensure_cache_dir(cache_path.parent.parent)
+        cache_path.parent.mkdir(exist_ok=True)
+        staging = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        staging.write_text(json.dumps(_encode_cached(record), ensure_ascii=False), encoding="utf-8")
+        os.replace(staging, cache_path)
+    except OSError:
+        pass
+
+
+def _layer_cache_path(cache_dir: Path, path: Path) -> Path:
+    digest = hashlib.sha256(str(path.absolute()).encode("utf-8")).hexdigest()[:32]
+    return cache_dir / "layers" / f"{digest}.json"
+
+
+def _cached_layer(
+    cache_path: Path, stat: os.stat_result, read: Callable[[], bytes]
+) -> dict[str, Any] | None:
+    record = _read_cache(cache_path)
+    if record is None or record.get("stat") != list(_stat_key(stat)):
+        return None
+    if stat.st_mtime_ns >= record["written_ns"] - _RACY_WINDOW_NS:
+        try:
+            content = read()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != record["sha256"]:
+            return None
+    return record["data"]
+
+
+# O_NONBLOCK keeps a FIFO at a layer path from blocking the open.
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0)
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while chunk := os.read(fd, max(size + 1, 65536)):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def load_toml(
+    path: Path, *, required: bool = False, cache_dir: Path | None = None
+) -> dict[str, Any]:
+    """Load a TOML table, allowing absence only for optional layers.
+
+    With `cache_dir`, parsed tables are reused from disk while the layer's
+    mtime, size, and inode are unchanged.
+    """
+    # One open answers "absent?", "a file?", and gives the stat; the slower
+    # exists()/is_file() probes only run to word an error.
     try:
-        with path.open("rb") as stream:
-            parsed = tomllib.load(stream)
-    except tomllib.TOMLDecodeError as error:
-        raise ConfigError(f"failed to parse {path}: {error}") from error
+        fd = os.open(path, _OPEN_FLAGS)
     except OSError as error:
+        if isinstance(error, FileNotFoundError) or not path.exists():
+            if required:
+                raise ConfigError(f"required TOML file not found: {path}") from None
+            return {}
+        if not path.is_file():
+            raise ConfigError(f"TOML layer is not a file: {path}") from None
         raise ConfigError(f"failed to read {path}: {error}") from error
+    try:
+        try:
+            stat = os.fstat(fd)
+        except OSError as error:
+            raise ConfigError(f"failed to read {path}: {error}") from error
+        if not stat_module.S_ISREG(stat.st_mode):
+            raise ConfigError(f"TOML layer is not a file: {path}")
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = _layer_cache_path(cache_dir, path)
+            cached = _cached_layer(cache_path, stat, lambda: _read_fd(fd, stat.st_size))
+            if cached is not None:
+                return cached
+        try:
+            content = _read_fd(fd, stat.st_size)
+            parsed = tomllib.loads(content.decode())
+        except tomllib.TOMLDecodeError as error:
+            raise ConfigError(f"failed to parse {path}: {error}") from error
+        except OSError as error:
+            raise ConfigError(f"failed to read {path}: {error}") from error
+    finally:
+        os.close(fd)
     if not isinstance(parsed, dict):
         raise ConfigError(f"TOML layer did not parse to a table: {path}")
+    if cache_path is not None:
+        _write_cache(
+            cache_path,
+            {
+                "stat": _stat_key(stat),
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "data": parsed,
+            },
+        )
     return parsed
 
 
+# Layer reads are handed to a few long-lived threads; spawning threads per
+# call would cost more than a local read saves.
+_LOADER_THREADS = 4
+_loader_queue: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+_loader_lock = threading.Lock()
+_loaders: list[threading.Thread] = []
+
+
+def _loader() -> None:
+    while True:
+        _loader_queue.get()()
+
+
+def _reset_loaders() -> None:
+    """A forked child inherits the pool's bookkeeping but none of its threads."""
+    global _loader_queue, _loader_lock, _loaders
+    _loader_queue = queue.SimpleQueue()
+    _loader_lock = threading.Lock()
+    _loaders = []
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_loaders)
+
+
+def _submit(task: Callable[[], None]) -> None:
+    if len(_loaders) < _LOADER_THREADS:
+        with _loader_lock:
+            if len(_loaders) < _LOADER_THREADS:
+                thread = threading.Thread(target=_loader, name="bmad-layer-loader", daemon=True)
+                thread.start()
+                _loaders.append(thread)
+    _loader_queue.put(task)
+
+
+def load_layers(
+    layers: list[tuple[Path, bool]], *, cache_dir: Path | None = None
+) -> list[dict[str, Any]]:
+    """`load_toml` every (path, required) layer, reading them concurrently.
+
+    Layer latency dominates on network filesystems, so layers after the first
+    are read on loader threads while the caller reads the first. Errors are
+    raised in layer order, as a serial load would raise them.
+    """
+    results: list[Any] = [None] * len(layers)
+    pending = [len(layers) - 1]
+    done = threading.Event()
+
+    def load(index: int) -> None:
+        path, required = layers[index]
+        try:
+            results[index] = load_toml(path, required=required, cache_dir=cache_dir)
+        except Exception as error:  # re-raised below in layer order
+            results[index] = error
+
+    def load_and_count(index: int) -> None:
+        load(index)
+        with _loader_lock:
+            pending[0] -= 1
+            if not pending[0]:
+                done.set()
+
+    for index in range(1, len(layers)):
+        _submit(lambda index=index: load_and_count(index))
+    if layers:
+        load(0)
+    if len(layers) > 1:
+        done.wait()
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
+def _identifier_error(field: str, value: Any) -> ConfigError | None:
+    if not isinstance(value, str):
+        return ConfigError(
+            f"keyed array identifier `{field}` must be a string, got {type(value).__name__}"
+        )
+    if not value:
+        return ConfigError(f"keyed array identifier `{field}` must not be empty")
+    return None
+
+
 def _detect_keyed_merge_field(items: list[Any]) -> str | None:
     if not items or not all(isinstance(item, dict) for item in items):
         return None
     for candidate in _KEYED_MERGE_FIELDS:
         if all(candidate in item for item in items):
             for item in items:
-                value = item[candidate]
-                if not isinstance(value, str):
-                    raise ConfigError(
-                        f"keyed array identifier `{candidate}` must be a string, "
-                        f"got {type(value).__name__}"
-                    )
-                if not value:
-                    raise ConfigError(
-                        f"keyed array identifier `{candidate}` must not be empty"
-                    )
+                error = _identifier_error(candidate, item[candidate])
+                if error is not None:
+                    raise error
             return candidate
     return None
 
@@ -57,27 +297,28 @@ def _detect_keyed_merge_field(items: list[Any]) -> str | None:
 def _merge_arrays(base: list[Any], override: list[Any]) -> list[Any]:
     keyed_field = _detect_keyed_merge_field(base + override)
     if keyed_field is None:
-        return list(base) + list(override)
-
-    result: list[Any] = []
-    index_by_key: dict[str, int] = {}
-    for item in base:
-        copied = dict(item)
-        index_by_key[copied[keyed_field]] = len(result)
-        result.append(copied)
+        return base + override
+
+    # Keyed items are replaced whole, never merged, so the result can hold the
+    # layer's own item tables instead of copies.
+    result = list(base)
+    index_by_key = {item[keyed_field]: index for index, item in enumerate(result)}
     for item in override:
-        copied = dict(item)
-        key = copied[keyed_field]
+        key = item[keyed_field]
         if key in index_by_key:
-            result[index_by_key[key]] = copied
+            result[index_by_key[key]] = item
         else:
             index_by_key[key] = len(result)
-            result.append(copied)
+            result.append(item)
     return result
 
 
 def structural_merge(base: Any, override: Any) -> Any:
-    """Merge tables recursively, keyed table arrays by identity, and append other arrays."""
+    """Merge tables recursively, keyed table arrays by identity, and append other arrays.
+
+    Only tables along the override's paths are copied; every other subtree is
+    shared with the inputs, so treat results as read-only.
+    """
     if isinstance(base, dict) and isinstance(override, dict):
         result = dict(base)
         for key, value in override.items():
@@ -88,32 +329,566 @@ def structural_merge(base: Any, override: Any) -> Any:
     return override
 
 
-def merge_layers(layers: Iterable[dict[str, Any]]) -> dict[str, Any]:
-    merged: dict[str, Any] = {}
-    for layer in layers:
-        merged = structural_merge(merged, layer)
-    return merged
+def _first_invalid_identifier(items: list[dict[str, Any]], field: str) -> ConfigError | None:
+    values = list(map(itemgetter(field), items))
+    if all(map(isinstance, values, repeat(str))) and all(values):
+        return None
+    return next(error for value in values if (error := _identifier_error(field, value)))
 
 
-def load_central_config(project_root: Path) -> dict[str, Any]:
-    bmad_dir = project_root / "_bmad"
-    return merge_layers(
-        (
-            load_toml(bmad_dir / "config.toml", required=True),
-            load_toml(bmad_dir / "config.user.toml"),
-            load_toml(bmad_dir / "custom" / "config.toml"),
-            load_toml(bmad_dir / "custom" / "config.user.toml"),
+class _ArrayRun:
+    """One array merged across consecutive layers, carrying its key index.
+
+    Folding `_merge_arrays` layer by layer re-detects the keyed field over the
+    whole accumulated array and rebuilds its index each time. Here what is
+    already known about the accumulated items (all tables, how many lack each
+    identifier, which identifiers were validated) and the key index survive
+    from one layer to the next, so each layer costs one pass over its own
+    items and detection reaches the same verdict.
+    """
+
+    __slots__ = ("items", "tables", "missing", "validated", "index_field", "index")
+
+    def __init__(self, items: list[Any]) -> None:
+        self.items = list(items)
+        self.tables = all(map(isinstance, self.items, repeat(dict)))
+        self.missing: dict[str, int] = {}
+        self.validated: set[str] = set()
+        self.index_field: str | None = None
+        self.index: dict[str, int] = {}
+
+    def _missing(self, field: str) -> int:
+        if field not in self.missing:
+            carrying = sum(map(contains, self.items, repeat(field)))
+            self.missing[field] = len(self.items) - carrying
+        return self.missing[field]
+
+    def _keyed_field(self, override: list[Any], override_tables: bool) -> str | None:
+        if not (self.tables and override_tables and (self.items or override)):
+            return None
+        for field in _KEYED_MERGE_FIELDS:
+            if self._missing(field) or not all(map(contains, override, repeat(field))):
+                continue
+            if field not in self.validated:
+                error = _first_invalid_identifier(self.items, field)
+                if error is not None:
+                    raise error
+                self.validated.add(field)
+            error = _first_invalid_identifier(override, field)
+            if error is not None:
+                raise error
+            return field
+        return None
+
+    def merge(self, override: list[Any]) -> None:
+        override_tables = all(map(isinstance, override, repeat(dict)))
+        field = self._keyed_field(override, override_tables)
+        if field is None:
+            self.items.extend(override)
+            self.tables = self.tables and override_tables
+            self.missing = {}
+            self.validated = set()
+            self.index_field = None
+            return
+        if self.index_field != field:
+            self.index = dict(zip(map(itemgetter(field), self.items), range(len(self.items))))
+            self.index_field = field
+        items, index = self.items, self.index
+        for item in override:
+            key = item[field]
+            position = index.get(key)
+            if position is None:
+                index[key] = len(items)
+                items.append(item)
+            else:
+                items[position] = item
+        # Replacements may change which items carry the other identifier.
+        self.missing = {field: 0}
+        self.validated = {field}
+
+
+def _merge_tables(tables: list[dict[str, Any]]) -> dict[str, Any]:
+    grouped: dict[str, list[Any]] = {}
+    for table in tables:
+        for key, value in table.items():
+            grouped.setdefault(key, []).append(value)
+    return {
+        key: values[0] if len(values) == 1 else _merge_values(values)
+        for key, values in grouped.items()
+    }
+
+
+def _merge_run(run: list[Any]) -> Any:
+    if len(run) == 1:
+        return run[0]
+    if isinstance(run[0], dict):
+        return _merge_tables(run)
+    array = _ArrayRun(run[0])
+    for override in run[1:]:
+        array.merge(override)
+    return array.items
+
+
+def _merge_values(values: list[Any]) -> Any:
+    """Merge one path's values across layers exactly as a pairwise fold would.
+
+    A value of another kind replaces everything before it, so the result comes
+    from the trailing run of tables (or arrays). Earlier runs are still merged
+    because a pairwise fold would have raised on their identifiers.
+    """
+    run: list[Any] = []
+    for value in values:
+        kind = dict if isinstance(value, dict) else list if isinstance(value, list) else None
+        if run and (kind is None or not isinstance(run[0], kind)):
+            _merge_run(run)
+            run = []
+        if kind is not None:
+            run.append(value)
+    return _merge_run(run) if run else values[-1]
+
+
+def merge_layers(
+    layers: Iterable[dict[str, Any]],
+    provenance: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """Merge layers in precedence order, each path merged across all layers at once.
+
+    Pass a dict as `provenance` to have it filled with the index of the layer
+    that supplied each leaf and array item; see `_record_provenance`.
+    """
+    if provenance is not None:
+        layers = list(layers)
+        merged = merge_layers(layers)
+        entries = [(index, layer) for index, layer in enumerate(layers) if layer]
+        _record_provenance(entries, merged, "", provenance)
+        return merged
+    present = [layer for layer in layers if layer]
+    if not present:
+        return {}
+    if len(present) == 1:
+        return present[0]
+    try:
+        return _merge_tables(present)
+    except ConfigError as error:
+        # Several bad identifiers may exist; fold pairwise so the one reported
+        # is the one a layer-by-layer merge reaches first.
+        merged = present[0]
+        for layer in present[1:]:
+            merged = structural_merge(merged, layer)
+        raise error
+
+
+def _trailing_run(entries: list[tuple[int, Any]], kind: type) -> list[tuple[int, Any]]:
+    start = len(entries)
+    while start and isinstance(entries[start - 1][1], kind):
+        start -= 1
+    return entries[start:]
+
+
+def _record_provenance(
+    entries: list[tuple[int, Any]],
+    merged: Any,
+    path: str,
+    provenance: dict[str, int],
+) -> None:
+    """Map each leaf (`a.b`) and array item (`a.items[2]`) of `merged` to its layer index.
+
+    `entries` pairs every layer value for `path` with its layer index. Array
+    items are attributed whole, as merging replaces or appends them whole.
+    """
+    if isinstance(merged, dict):
+        tables = _trailing_run(entries, dict)
+        for key, value in merged.items():
+            child = [(index, table[key]) for index, table in tables if key in table]
+            _record_provenance(child, value, f"{path}.{key}" if path else key, provenance)
+    elif isinstance(merged, list):
+        arrays = _trailing_run(entries, list)
+        if len(merged) == sum(len(array) for _, array in arrays):
+            # Nothing was replaced, so the merge is a concatenation.
+            owners = [index for index, array in arrays for _ in array]
+        else:
+            # Keyed items are tables, and merging keeps the winning table itself.
+            by_id = {id(item): index for index, array in arrays for item in array}
+            owners = [by_id[id(item)] for item in merged]
+        for position, owner in enumerate(owners):
+            provenance[f"{path}[{position}]"] = owner
+    else:
+        provenance[path] = entries[-1][0]
+
+
+MISSING = object()
+
+
+def extract_key(data: Any, dotted_key: str) -> Any:
+    """The value at a dotted path through nested tables, or MISSING."""
+    current = data
+    for part in dotted_key.split("."):
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return MISSING
+    return current
+
+
+def select_keys(merged: dict[str, Any], keys: list[str]) -> dict[str, Any]:
+    """Project a merged table onto dotted keys; absent keys are left out."""
+    if not keys:
+        return merged
+    output = {}
+    for key in keys:
+        value = extract_key(merged, key)
+        if value is not MISSING:
+            output[key] = value
+    return output
+
+
+def merge_path(layers: Iterable[dict[str, Any]], dotted_key: str) -> Any:
+    """Merge only the subtree at `dotted_key`, or return MISSING.
+
+    Yields what `extract_key(merge_layers(layers), dotted_key)` would, without
+    merging unrelated tables. Identifier errors outside the path are therefore
+    not raised.
+    """
+    values: list[Any] = [layer for layer in layers if layer]
+    for part in dotted_key.split("."):
+        # A merged table is built from the trailing run of tables only.
+        start = len(values)
+        while start and isinstance(values[start - 1], dict):
+            start -= 1
+        values = [table[part] for table in values[start:] if part in table]
+        if not values:
+            return MISSING
+    return _merge_values(values)
+
+
+def merge_selected(layers: list[dict[str, Any]], keys: list[str]) -> dict[str, Any]:
+    """Like `select_keys(merge_layers(layers), keys)`, merging only the keyed paths."""
+    if not keys:
+        return merge_layers(layers)
+    output = {}
+    for key in keys:
+        value = merge_path(layers, key)
+        if value is not MISSING:
+            output[key] = value
+    return output
+
+
+def explain_merge(
+    layer_paths: list[Path],
+    layers: list[dict[str, Any]],
+    keys: list[str],
+) -> dict[str, Any]:
+    """Merge `layers` and name the file behind each resolved leaf and array item."""
+    provenance: dict[str, int] = {}
+    merged = merge_layers(layers, provenance)
+    explain = {
+        path: str(layer_paths[index])
+        for path, index in provenance.items()
+        if not keys
+        or any(
+            path == key or path.startswith((f"{key}.", f"{key}[")) for key in keys
         )
+    }
+    return {"resolved": select_keys(merged, keys), "explain": explain}
+
+
+def central_layers(project_root: Path) -> list[tuple[Path, bool]]:
+    """The four central layers in precedence order, with whether each is required."""
+    bmad_dir = project_root / "_bmad"
+    return [
+        (bmad_dir / "config.toml", True),
+        (bmad_dir / "config.user.toml", False),
+        (bmad_dir / "custom" / "config.toml", False),
+        (bmad_dir / "custom" / "config.user.toml", False),
+    ]
+
+
+def fingerprint_layers(layers: Iterable[tuple[Path, bool]]) -> tuple[Any, ...]:
+    """Stat every layer; absent layers count, so creating one invalidates."""
+    fingerprint = []
+    for path, _ in layers:
+        try:
+            fingerprint.append((str(path), _stat_key(path.stat())))
+        except OSError:
+            fingerprint.append((str(path), None))
+    return tuple(fingerprint)
+
+
+def _snapshot_cache_path(cache_dir: Path, name: str) -> Path:
+    digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:32]
+    return cache_dir / "snapshots" / f"{digest}.json"
+
+
+def fingerprint_settled(fingerprint: tuple[Any, ...], recorded_ns: int) -> bool:
+    """True when no layer changed inside the racy window before `recorded_ns`.
+
+    A layer touched that close to the recording may hide a same-size edit, so
+    merged results keyed on it must not be trusted.
+    """
+    horizon = recorded_ns - _RACY_WINDOW_NS
+    return all(stat is None or stat[0] < horizon for _, stat in fingerprint)
+
+
+def _cached_snapshot(cache_path: Path, fingerprint: tuple[Any, ...]) -> dict[str, Any] | None:
+    record = _read_cache(cache_path)
+    if record is None or record.get("fingerprint") != _json_fingerprint(fingerprint):
+        return None
+    # Unsettled layers fall through to the per-layer cache, which re-hashes content.
+    if not fingerprint_settled(fingerprint, record["written_ns"]):
+        return None
+    return record["data"]
+
+
+def _central_snapshot(project_root: Path) -> tuple[Path, tuple[Any, ...], Any]:
+    cache_dir = cache_dir_for(project_root)
+    fingerprint = fingerprint_layers(central_layers(project_root))
+    snapshot_path = _snapshot_cache_path(cache_dir, f"central:{project_root.absolute()}")
+    cached = _bundled(project_root, None, fingerprint)
+    if cached is None:
+        cached = _cached_snapshot(snapshot_path, fingerprint)
+    return snapshot_path, fingerprint, cached
+
+
+def _load_central_layers(project_root: Path) -> list[dict[str, Any]]:
+    return load_layers(central_layers(project_root), cache_dir=cache_dir_for(project_root))
+
+
+def load_central_config(project_root: Path) -> dict[str, Any]:
+    """Merge the central layers, serving an unchanged fingerprint from the snapshot."""
+    snapshot_path, fingerprint, cached = _central_snapshot(project_root)
+    if cached is not None:
+        return cached
+    merged = merge_layers(_load_central_layers(project_root))
+    _write_cache(snapshot_path, {"fingerprint": fingerprint, "data": merged})
+    return merged
+
+
+def load_central_keys(project_root: Path, keys: list[str]) -> dict[str, Any]:
+    """Resolve dotted keys from the central layers without a full merge on a snapshot miss."""
+    if not keys:
+        return load_central_config(project_root)
+    _, _, cached = _central_snapshot(project_root)
+    if cached is not None:
+        return select_keys(cached, keys)
+    return merge_selected(_load_central_layers(project_root), keys)
+
+
+def explain_central_config(project_root: Path, keys: list[str]) -> dict[str, Any]:
+    """`explain_merge` over the central layers; never served from the snapshot."""
+    return explain_merge(
+        [path for path, _ in central_layers(project_root)],
+        _load_central_layers(project_root),
+        keys,
     )
 
 
-def load_customization(project_root: Path | None, skill_dir: Path) -> dict[str, Any]:
-    skill_name = skill_dir.name
-    custom_dir = project_root / "_bmad" / "custom" if project_root else None
-    return merge_layers(
-        (
-            load_toml(skill_dir / "customize.toml", required=True),
-            load_toml(custom_dir / f"{skill_name}.toml") if custom_dir else {},
-            load_toml(custom_dir / f"{skill_name}.user.toml") if custom_dir else {},
-        )
+def customization_layers(
+    project_root: Path | None, skill_dir: Path
+) -> list[tuple[Path, bool]]:
+    """A skill's default, team, and user layers in precedence order."""
+    layers = [(skill_dir / "customize.toml", True)]
+    if project_root:
+        custom_dir = project_root / "_bmad" / "custom"
+        layers.append((custom_dir / f"{skill_dir.name}.toml", False))
+        layers.append((custom_dir / f"{skill_dir.name}.user.toml", False))
+    return layers
+
+
+def list_custom_dir(project_root: Path | None) -> frozenset[str] | None:
+    """Entry names in _bmad/custom/, listed once so batch callers skip per-layer stats."""
+    if not project_root:
+        return None
+    try:
+        with os.scandir(project_root / "_bmad" / "custom") as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+def _load_customization_layers(
+    project_root: Path | None,
+    skill_dir: Path,
+    custom_listing: frozenset[str] | None,
+) -> list[dict[str, Any]]:
+    # Only installed projects get a cache; a bare .git root never grows a _bmad/.
+    cache_dir = (
+        cache_dir_for(project_root)
+        if project_root and (project_root / "_bmad").is_dir()
+        else None
+    )
+    layers = customization_layers(project_root, skill_dir)
+    wanted = [
+        index
+        for index, (path, required) in enumerate(layers)
+        if custom_listing is None or required or path.name in custom_listing
+    ]
+    loaded = load_layers([layers[index] for index in wanted], cache_dir=cache_dir)
+    tables: list[dict[str, Any]] = [{} for _ in layers]
+    for index, table in zip(wanted, loaded):
+        tables[index] = table
+    return tables
+
+
+def load_customization(
+    project_root: Path | None,
+    skill_dir: Path,
+    *,
+    custom_listing: frozenset[str] | None = None,
+) -> dict[str, Any]:
+    bundled = _bundled_customization(project_root, skill_dir)
+    if bundled is not None:
+        return bundled
+    return merge_layers(_load_customization_layers(project_root, skill_dir, custom_listing))
+
+
+def load_customization_keys(
+    project_root: Path | None,
+    skill_dir: Path,
+    keys: list[str],
+    *,
+    custom_listing: frozenset[str] | None = None,
+) -> dict[str, Any]:
+    """Resolve dotted keys from a skill's layers, merging only the keyed paths."""
+    bundled = _bundled_customization(project_root, skill_dir)
+    if bundled is not None:
+        return select_keys(bundled, keys)
+    return merge_selected(
+        _load_customization_layers(project_root, skill_dir, custom_listing), keys
+    )
+
+
+def explain_customization(
+    project_root: Path | None,
+    skill_dir: Path,
+    keys: list[str],
+    *,
+    custom_listing: frozenset[str] | None = None,
+) -> dict[str, Any]:
+    """`explain_merge` over a skill's customization layers."""
+    return explain_merge(
+        [path for path, _ in customization_layers(project_root, skill_dir)],
+        _load_customization_layers(project_root, skill_dir, custom_listing),
+        keys,
+    )
+
+
+def discover_skills(skills_root: Path) -> list[Path]:
+    """Every skill directory under `skills_root` that ships a customize.toml."""
+    if not skills_root.is_dir():
+        raise ConfigError(f"skills root is not a directory: {skills_root}")
+    return sorted(
+        path.parent
+        for path in skills_root.rglob("customize.toml")
+        if not any(part.startswith(".") for part in path.relative_to(skills_root).parts)
     )
+
+
+# Compiled bundle: _bmad/config.bundle holds the merged central config and
+# skill customizations as JSON, each next to the fingerprints of its layers.
+# TOML dates and times are tagged as in the layer cache.
+# Entries whose layers changed since compiling are ignored, not trusted.
+
+
+def bundle_path(project_root: Path) -> Path:
+    return project_root / "_bmad" / "config.bundle"
+
+
+def _json_fingerprint(fingerprint: tuple[Any, ...]) -> list[Any]:
+    return [[path, list(stat) if stat else None] for path, stat in fingerprint]
+
+
+def compile_bundle(project_root: Path, skill_dirs: Iterable[Path]) -> dict[str, Any]:
+    """Merge central config and every skill's customization into one bundle.
+
+    Layer errors raise ConfigError, so a written bundle only holds values that
+    resolved cleanly. Fingerprints are taken before each read so an edit made
+    while compiling invalidates its entry.
+    """
+    compiled_ns = time.time_ns()
+    fingerprint = fingerprint_layers(central_layers(project_root))
+    central = {
+        "layers": _json_fingerprint(fingerprint),
+        "data": merge_layers(_load_central_layers(project_root)),
+    }
+    custom_listing = list_custom_dir(project_root)
+    skills = {}
+    for skill_dir in skill_dirs:
+        fingerprint = fingerprint_layers(customization_layers(project_root, skill_dir))
+        skills[str(skill_dir)] = {
+            "layers": _json_fingerprint(fingerprint),
+            "data": merge_layers(
+                _load_customization_layers(project_root, skill_dir, custom_listing)
+            ),
+        }
+    return {
+        "format": _BUNDLE_FORMAT,
+        "compiled_ns": compiled_ns,
+        "central": central,
+        "skills": skills,
+    }
+
+
+def write_bundle(project_root: Path, bundle: dict[str, Any]) -> Path:
+    path = bundle_path(project_root)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_text(
+            json.dumps(_encode_cached(bundle), ensure_ascii=False), encoding="utf-8"
+        )
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+# Parsed bundles by path, reused while the bundle file's stat is unchanged.
+_BUNDLES: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+def _read_bundle(project_root: Path) -> dict[str, Any] | None:
+    path = bundle_path(project_root)
+    try:
+        stat_key = _stat_key(path.stat())
+    except OSError:
+        return None
+    memo = _BUNDLES.get(path)
+    if memo is not None and memo[0] == stat_key:
+        return memo[1]
+    try:
+        raw = path.read_bytes()
+        bundle = json.loads(raw, object_hook=_decode_cached if b'"$' in raw else None)
+    except (OSError, ValueError, TypeError):
+        return None
+    if not isinstance(bundle, dict) or bundle.get("format") != _BUNDLE_FORMAT:
+        return None
+    _BUNDLES[path] = (stat_key, bundle)
+    return bundle
+
+
+def _bundled(
+    project_root: Path, skill_dir: Path | None, fingerprint: tuple[Any, ...]
+) -> dict[str, Any] | None:
+    """The bundle's merged data for central config (skill_dir None) or a skill, if current."""
+    bundle = _read_bundle(project_root)
+    if bundle is None:
+        return None
+    try:
+        entry = bundle["central"] if skill_dir is None else bundle["skills"].get(str(skill_dir))
+        if entry is None or entry["layers"] != _json_fingerprint(fingerprint):
+            return None
+        if not fingerprint_settled(fingerprint, bundle["compiled_ns"]):
+            return None
+        return entry["data"]
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _bundled_customization(project_root: Path | None, skill_dir: Path) -> dict[str, Any] | None:
+    if not project_root:
+        return None
+    bundle = _read_bundle(project_root)
+    if bundle is None or str(skill_dir) not in bundle.get("skills", ()):
+        return None
+    fingerprint = fingerprint_layers(customization_layers(project_root, skill_dir))
+    return _bundled(project_root, skill_dir, fingerprint)
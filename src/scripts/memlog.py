@@ -22,8 +22,8 @@ Three invariants make it trustworthy:
      edit or delete subcommand by design; history is never rewritten.
   2. Write-only / blind. Every command is an atomic, context-free write and echoes the
      new state as one line of JSON, so the caller never re-reads the file mid-session.
-     The one time the file is read is on resume — and the caller reads it itself, not
-     via this script.
+     The one time the file is read is on resume — and the caller reads it itself, or
+     just the slice it needs through `query`.
   3. No lifecycle status. A memory log has no "complete" flag. Whether the work is done,
      blocked, or paused is itself a fact that happened, so it is recorded as an entry
      (e.g. `append --type event --text "session complete"`), never as frontmatter the
@@ -31,8 +31,32 @@ Three invariants make it trustworthy:
      resume learns the state by reading the last entries — the same way it learns
      everything else.
 
-Atomicity: every write goes to a temp file, is flushed and fsync'd, then atomically
-renamed over the target, so a crash never leaves a half-written entry.
+Atomicity: `init`, `set`, and the first entry go to a temp file that is flushed and
+fsync'd, then atomically renamed over the target. Later appends cost the same however
+long the log is: the entry is written with O_APPEND and the fixed-width `updated` stamp
+is overwritten in place, after a write-ahead record (`.memlog.md.wal`: old size, new
+size, sha256 of the appended bytes) is fsync'd. The next command replays that record,
+keeping a fully landed append and truncating a partial one, so a crash never leaves a
+half-written entry.
+
+Entry count: `.memlog.md.count` caches the count with the size, mtime, and inode the
+memlog had when it was written, plus how many labels the index used, so acknowledging a
+write never rescans the body. A missing sidecar, or one that no longer matches (a hand
+edit, a crash between the memlog write and the sidecar, a lost or truncated labels
+sidecar), is healed by one full recount.
+
+Reading back: appends also maintain `.memlog.md.idx`, one fixed-width record per entry
+(segment, byte offset from the start of its body, type, author), with type and author names kept
+in `.memlog.md.labels`. `query` filters by type/author and slices by range or tail
+through that index, then reads only the matching lines. The index heals with the count.
+
+Segments: for very long sessions, set a `segment_bytes` field (`init --field
+segment_bytes=1048576`, or `set`). Once the body reaches that size after an append, it
+is sealed verbatim into the next numbered segment (`.memlog.md.0001`, `.0002`, …) and
+the head keeps the frontmatter plus a `segments` manifest of per-segment entry counts.
+Sealed segments are never written again, so appends touch only the head, and entry
+numbers, the count, and `query` run across every segment as one chronological log. To
+read it whole, read the segments in order, then the head's body.
 
 The file shape (.memlog.md):
 
@@ -61,7 +85,11 @@ for a plain note. The host skill names the vocabulary; the script does not enfor
 Commands:
   init   (--workspace DIR | --path FILE) [--field k=v ...]    create the memlog (errors if it exists)
   append (--workspace DIR | --path FILE) --text STR [--type T] [--by W]  append one entry at the end
+  append-batch (--workspace DIR | --path FILE) [--file JSONL]  append every {"text", "type", "by"}
+         line of the file (or stdin) at the end, in order, as one atomic write
   set    (--workspace DIR | --path FILE) --key K --value V    set/replace a descriptive frontmatter field
+  query  (--workspace DIR | --path FILE) [--type T ...] [--by W ...] [--range A:B] [--tail N]
+         echo matching entries as JSON {n, type, by, text} without scanning the log
 
 Addressing: `--workspace` is the run folder, and the memlog is always {workspace}/.memlog.md.
 `--path` points straight at the memlog file instead, for callers that already hold the path.
@@ -69,9 +97,12 @@ Addressing: `--workspace` is the run folder, and the memlog is always {workspace
 from __future__ import annotations  # keep type-hint syntax lazy so the script runs on 3.8+
 
 import argparse
+import hashlib
 import json
 import os
+import struct
 import sys
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
 
@@ -99,12 +130,16 @@ def split(text: str) -> tuple[dict, str]:
     end = next((i for i in range(1, len(lines)) if lines[i] == "---"), None)
     if end is None:
         raise ValueError(".memlog.md frontmatter is not terminated")
+    return fields(lines[1:end]), "\n".join(lines[end + 1:]).lstrip("\n")
+
+
+def fields(lines: list[str]) -> dict:
     meta: dict[str, str] = {}
-    for line in lines[1:end]:
+    for line in lines:
         if ":" in line:
             k, v = line.split(":", 1)
             meta[k.strip()] = v.strip()
-    return meta, "\n".join(lines[end + 1:]).lstrip("\n")
+    return meta
 
 
 def render(meta: dict, body: str) -> str:
@@ -119,26 +154,309 @@ def touch(meta: dict) -> None:
     meta["updated"] = now()
 
 
-def write_atomic(path: Path, text: str) -> None:
+def write_atomic(path: Path, text: str | bytes) -> None:
     """Temp + flush + fsync + atomic rename, so a crash never half-writes an entry."""
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        f.write(text)
+    # Bytes, never text mode: `head` and the in-place append rely on "\n" line ends everywhere.
+    with open(tmp, "wb") as f:
+        f.write(text if isinstance(text, bytes) else text.encode("utf-8"))
         f.flush()
         os.fsync(f.fileno())
     os.replace(tmp, path)
 
 
-def entry_count(body: str) -> int:
-    return sum(1 for ln in body.splitlines() if ln.startswith("- "))
+def format_entry(text: str, entry_type: str | None, by: str | None) -> str:
+    text = " ".join(text.split())  # collapse newlines/runs → one-line entry, no prose bloat
+    label = entry_type or ""
+    if by:
+        label = f"{label} by {by}".strip()  # attribution: "(idea by user)" / "(by coach)"
+    tag = f"({label}) " if label else ""
+    return f"- {tag}{text}"
+
+
+def wal_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".wal")
+
+
+def recover(path: Path) -> None:
+    """Replay the write-ahead record a crashed append left: keep it if it fully landed, else cut it."""
+    wal = wal_path(path)
+    try:
+        record = wal.read_text(encoding="ascii")
+    except FileNotFoundError:
+        return
+    fields = record.split()
+    # A torn record was never fsync'd, so its append never started.
+    if record.endswith("\n") and len(fields) == 3 and len(fields[2]) == 64:
+        old_size, new_size, digest = int(fields[0]), int(fields[1]), fields[2]
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(old_size)
+            landed = size == new_size and hashlib.sha256(f.read()).hexdigest() == digest
+            if not landed and size > old_size:
+                f.truncate(old_size)
+                f.flush()
+                os.fsync(f.fileno())
+    wal.unlink(missing_ok=True)
+
+
+def head(f) -> tuple[int, int, dict] | None:
+    """(offset of the `updated` value, offset of the body, frontmatter) of an open memlog,
+    read only up to the closing fence; None when the layout is not what `render` writes,
+    e.g. hand-edited."""
+    f.seek(0)
+    data = b""
+    while True:
+        chunk = f.read(4096)
+        data += chunk
+        end = data.find(b"\n---\n")
+        if end != -1 or not chunk:
+            break
+    if not data.startswith(b"---\n") or end == -1 or data[end + 5:end + 6] != b"\n":
+        return None
+    last = data.rfind(b"\n", 0, end) + 1  # `touch` keeps `updated` as the last field
+    if last == 0 or not data.startswith(b"updated: ", last) or end - last != len("updated: " + now()):
+        return None
+    meta = fields(data[4:end].decode("utf-8").split("\n"))
+    return last + len("updated: "), end + 6, meta
+
+
+def append_in_place(path: Path, lines: str) -> tuple[dict, int, int] | None:
+    """Append entry lines and restamp `updated` without rewriting the file, returning (the
+    frontmatter, where they start in the body, the body's new size); None when the body is
+    empty or the layout is unexpected, so the caller falls back to a full rewrite."""
+    data = lines.encode("utf-8")
+    with open(path, "r+b") as f:
+        offsets = head(f)
+        size = f.seek(0, os.SEEK_END)
+        if offsets is None or size <= offsets[1] + 1:
+            return None
+        f.seek(size - 2)
+        tail = f.read(2)
+        if tail[1:] != b"\n" or tail[:1] == b"\n":  # `render` ends on one non-empty line
+            return None
+        wal = wal_path(path)
+        with open(wal, "w", encoding="ascii") as w:
+            w.write(f"{size} {size + len(data)} {hashlib.sha256(data).hexdigest()}\n")
+            w.flush()
+            os.fsync(w.fileno())
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        f.seek(offsets[0])
+        f.write(now().encode("ascii"))
+        f.flush()
+        os.fsync(f.fileno())  # covers the appended bytes too: fsync is per file, not per handle
+    wal.unlink(missing_ok=True)  # a concurrent recover() may have replayed it already
+    return offsets[2], size - offsets[1], size + len(data) - offsets[1]
+
+
+def parse_entry(line: str) -> tuple[str | None, str | None, str]:
+    """(type, by, text) of an entry line, read back from the tag `format_entry` writes."""
+    text = line[2:]
+    if not text.startswith("(") or ") " not in text:
+        return None, None, text
+    label, text = text[1:].split(") ", 1)
+    if label.startswith("by "):
+        return None, label[3:], text
+    entry_type, _, by = label.partition(" by ")
+    return entry_type, by or None, text
+
+
+def segment_path(path: Path, number: int) -> Path:
+    return path.with_suffix(path.suffix + f".{number:04d}")
+
+
+def segment_counts(meta: dict) -> list[int]:
+    """Entries in each sealed segment, from the head's `segments` manifest."""
+    value = meta.get("segments", "")
+    try:
+        return [int(count) for count in value.split(",")] if value else []
+    except ValueError:
+        raise ValueError(f".memlog.md segments field is malformed: {value!r}") from None
+
+
+def active_segment(meta: dict) -> int:
+    """The number the head's entries will carry once sealed; their index records use it."""
+    return len(segment_counts(meta)) + 1
+
+
+def segment_limit(meta: dict) -> int:
+    value = meta.get("segment_bytes", "")
+    return int(value) if value.isdigit() else 0
+
+
+def rotate(path: Path) -> None:
+    """Seal the head's body, verbatim, as the next numbered segment and empty the head."""
+    with open(path, "rb") as f:
+        layout = head(f)
+        if layout is None:
+            return
+        _, body_at, meta = layout
+        f.seek(body_at)
+        region = f.read()
+    counts = segment_counts(meta)
+    # Sealed first: a crash before the head rewrite leaves an unlisted segment file that
+    # the next rotation overwrites, and the head still holds every entry.
+    write_atomic(segment_path(path, len(counts) + 1), region)
+    meta["segments"] = ",".join(map(str, counts + [region.count(b"\n- ") + region.startswith(b"- ")]))
+    touch(meta)
+    write_atomic(path, render(meta, ""))
 
 
-def ack(path: Path, body: str) -> None:
+def logical_entries(path: Path) -> list[str]:
+    """Every entry line, sealed segments first, by parsing the text — the fallback for a
+    head whose layout was edited by hand."""
+    meta, body = split(path.read_text(encoding="utf-8"))
+    texts = [segment_path(path, number).read_text(encoding="utf-8")
+             for number in range(1, active_segment(meta))]
+    return [ln for text in texts + [body] for ln in text.splitlines() if ln.startswith("- ")]
+
+
+# Offset index: one fixed-width record per entry — the segment holding it, its byte offset
+# from the start of that segment's body, then its type and author as ids into the labels
+# sidecar (0 = none). Offsets are relative to the body so `set` rewriting the frontmatter
+# never invalidates them, and a segment is the head's body verbatim so sealing doesn't.
+RECORD = struct.Struct("<IQII")
+
+
+def index_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".idx")
+
+
+def labels_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".labels")
+
+
+def load_labels(path: Path) -> list[str] | None:
+    """The labels sidecar, or None when it is missing or damaged."""
+    try:
+        labels = json.loads(labels_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return labels if isinstance(labels, list) and all(isinstance(x, str) for x in labels) else None
+
+
+def index_entries(path: Path, lines: list[tuple[int, int, str]], fresh: bool = False) -> None:
+    """Add index records for (segment, body offset, entry line); `fresh` replaces the index.
+    A cache like the count sidecar, and written before it, so a crash in between only
+    costs one rebuild."""
+    labels = [] if fresh else load_labels(path)
+    if labels is None:  # new ids against a lost sidecar would re-attribute every older record
+        reindex(path)
+        return
+    ids = {label: number for number, label in enumerate(labels, 1)}
+    known = len(labels)
+    records = bytearray()
+    for segment, offset, line in lines:
+        entry_type, by, _ = parse_entry(line)
+        record = [segment, offset]
+        for label in (entry_type, by):
+            if label is not None and label not in ids:
+                labels.append(label)
+                ids[label] = len(labels)
+            record.append(0 if label is None else ids[label])
+        records += RECORD.pack(*record)
+    if fresh or len(labels) > known:
+        sidecar = labels_path(path)
+        tmp = sidecar.with_suffix(sidecar.suffix + ".tmp")
+        tmp.write_text(json.dumps(labels, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, sidecar)
+    with open(index_path(path), "wb" if fresh else "ab") as f:
+        f.write(records)
+
+
+def index_holds(path: Path, entries: int) -> bool:
+    try:
+        return index_path(path).stat().st_size == entries * RECORD.size
+    except OSError:
+        return False
+
+
+def placed(segment: int, start: int, new: list[str]) -> list[tuple[int, int, str]]:
+    """(segment, body offset, line) for entry lines written back to back from `start`."""
+    lines = []
+    for entry in new:
+        lines.append((segment, start, entry))
+        start += len(entry.encode("utf-8")) + 1
+    return lines
+
+
+def scan(segment: int, body: bytes) -> list[tuple[int, int, str]]:
+    lines = []
+    position = 0
+    for raw in body.split(b"\n"):
+        if raw.startswith(b"- "):
+            lines.append((segment, position, raw.decode("utf-8")))
+        position += len(raw) + 1
+    return lines
+
+
+def reindex(path: Path) -> int:
+    """Rebuild the offset index from the segments and head and return the entry count —
+    the one full scan that heals the count and index sidecars together."""
+    with open(path, "rb") as f:
+        layout = head(f)
+        if layout is not None:
+            f.seek(layout[1])
+            body = f.read()
+    if layout is None:  # hand-edited layout: count only; `query` parses the text instead
+        index_path(path).unlink(missing_ok=True)
+        return len(logical_entries(path))
+    active = active_segment(layout[2])
+    lines = []
+    for number in range(1, active):
+        lines += scan(number, segment_path(path, number).read_bytes())
+    index_entries(path, lines + scan(active, body), fresh=True)
+    return len(lines) + len(scan(active, body))
+
+
+def count_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".count")
+
+
+def stat_key(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size} {st.st_mtime_ns} {st.st_ino}"
+
+
+def cached_count(path: Path) -> int | None:
+    """The sidecar's count while the memlog still has the stat it was recorded against and
+    the labels sidecar still names every label the index had then."""
+    try:
+        count, _, rest = count_path(path).read_text(encoding="ascii").strip().partition(" ")
+        key, _, known = rest.rpartition(" ")
+        if not (count.isdigit() and known.isdigit() and key == stat_key(path)):
+            return None
+    except OSError:
+        return None
+    labels = load_labels(path)
+    return int(count) if labels is not None and len(labels) >= int(known) else None
+
+
+def store_count(path: Path, entries: int) -> None:
+    """Record the count for the memlog as it is now. A cache, so no fsync: a stale or lost
+    sidecar only costs one recount."""
+    sidecar = count_path(path)
+    tmp = sidecar.with_suffix(sidecar.suffix + ".tmp")
+    labels = load_labels(path) or []
+    try:
+        tmp.write_text(f"{entries} {stat_key(path)} {len(labels)}\n", encoding="ascii")
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass
+
+
+def ack(path: Path, entries: int) -> None:
     """Echo new state so the caller never re-reads the file to know where it stands."""
     print(json.dumps({
         "ok": True,
         "memlog": str(path),
-        "entries": entry_count(body),
+        "entries": entries,
     }))
 
 
@@ -154,36 +472,182 @@ def cmd_init(args) -> int:
             print(f"error: --field expects key=value, got {pair!r}", file=sys.stderr)
             return 2
         k, v = pair.split("=", 1)
+        if k.strip() == "segments":
+            print("error: segments is kept by the tool; it cannot be set", file=sys.stderr)
+            return 2
         meta[k.strip()] = v.strip()
     touch(meta)
     write_atomic(path, render(meta, ""))
-    ack(path, "")
+    index_entries(path, [], fresh=True)
+    store_count(path, 0)
+    ack(path, 0)
     return 0
 
 
+def append_entries(path: Path, new: list[str]) -> int:
+    """Append entry lines at the end, in order, as one atomic write; returns the new count.
+    Seals the head as a segment once its body reaches the `segment_bytes` threshold."""
+    recover(path)
+    entries = cached_count(path)
+    if entries is not None and not index_holds(path, entries):
+        entries = None
+    written = append_in_place(path, "".join(entry + "\n" for entry in new))
+    if written is not None:
+        meta, start, size = written
+        if entries is None:  # stale sidecars heal from the file as it now is, new entries included
+            entries = reindex(path)
+        else:
+            index_entries(path, placed(active_segment(meta), start, new))
+            entries += len(new)
+    else:
+        meta, body = split(path.read_text(encoding="utf-8"))
+        fresh = not body.strip()
+        lines = "\n".join(new)
+        body = (body.rstrip("\n") + "\n" + lines) if body.strip() else lines  # always at the end
+        touch(meta)
+        write_atomic(path, render(meta, body))
+        size = len(body.encode("utf-8")) + 1
+        if entries is not None and fresh:  # e.g. just after a seal: no need to rescan segments
+            index_entries(path, placed(active_segment(meta), 0, new))
+            entries += len(new)
+        else:
+            entries = reindex(path)
+    if 0 < segment_limit(meta) <= size:
+        rotate(path)  # count and index records already carry the sealed segment's number
+    store_count(path, entries)
+    return entries
+
+
 def cmd_append(args) -> int:
     path = resolve(args)
-    meta, body = split(path.read_text(encoding="utf-8"))
-    text = " ".join(args.text.split())  # collapse newlines/runs → one-line entry, no prose bloat
-    label = args.type or ""
-    if args.by:
-        label = f"{label} by {args.by}".strip()  # attribution: "(idea by user)" / "(by coach)"
-    tag = f"({label}) " if label else ""
-    entry = f"- {tag}{text}"
-    body = (body.rstrip("\n") + "\n" + entry) if body.strip() else entry  # always at the end
-    touch(meta)
-    write_atomic(path, render(meta, body))
-    ack(path, body)
+    ack(path, append_entries(path, [format_entry(args.text, args.type, args.by)]))
+    return 0
+
+
+def parse_batch(lines) -> list[str]:
+    """Entries from JSON lines of {"text": ..., "type": ..., "by": ...}; blank lines are skipped."""
+    new = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {number}: not JSON ({e})") from None
+        if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+            raise ValueError(f"line {number}: expected an object with a string \"text\"")
+        for key in ("type", "by"):
+            if item.get(key) is not None and not isinstance(item[key], str):
+                raise ValueError(f"line {number}: \"{key}\" must be a string")
+        new.append(format_entry(item["text"], item.get("type"), item.get("by")))
+    return new
+
+
+def cmd_append_batch(args) -> int:
+    path = resolve(args)
+    try:
+        if args.file and args.file != "-":
+            with open(args.file, encoding="utf-8") as f:
+                new = parse_batch(f)
+        else:
+            new = parse_batch(sys.stdin)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)  # nothing is written unless every line parses
+        return 2
+    if not new:
+        print("error: append-batch got no entries", file=sys.stderr)
+        return 2
+    ack(path, append_entries(path, new))
     return 0
 
 
 def cmd_set(args) -> int:
     path = resolve(args)
+    if args.key == "segments":
+        print("error: segments is kept by the tool; it cannot be set", file=sys.stderr)
+        return 2
+    recover(path)
     meta, body = split(path.read_text(encoding="utf-8"))
     meta[args.key] = args.value
+    entries = cached_count(path)
     touch(meta)
     write_atomic(path, render(meta, body))
-    ack(path, body)
+    # Index offsets are relative to the body, so a frontmatter rewrite leaves them valid.
+    entries = reindex(path) if entries is None else entries
+    store_count(path, entries)
+    ack(path, entries)
+    return 0
+
+
+def parse_range(text: str) -> tuple[int, int | None]:
+    """`A:B`, `A:`, or `:B` — 1-based entry numbers, inclusive."""
+    first, sep, last = text.partition(":")
+    try:
+        bounds = (int(first) if first else 1, int(last) if last else None)
+    except ValueError:
+        bounds = (0, None)
+    if not sep or bounds[0] < 1 or (bounds[1] is not None and bounds[1] < 1):
+        raise ValueError(f"--range expects START:END entry numbers from 1, got {text!r}")
+    return bounds
+
+
+def cmd_query(args) -> int:
+    path = resolve(args)
+    try:
+        first, last = parse_range(args.range) if args.range else (1, None)
+        if args.tail is not None and args.tail < 0:
+            raise ValueError("--tail must not be negative")
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    recover(path)
+    entries = cached_count(path)
+    if entries is None or not index_holds(path, entries):
+        entries = reindex(path)
+        store_count(path, entries)
+    last = entries if last is None else min(last, entries)
+    filtered = bool(args.type or args.by)
+    if args.tail is not None and not filtered:
+        first = max(first, last - args.tail + 1)  # tail alone reads only the records it needs
+    with open(path, "rb") as f, ExitStack() as sealed_files:
+        layout = head(f)
+        if layout is None:  # hand-edited layout, so no index: parse the text
+            lines = logical_entries(path)
+            rows = [(n, *parse_entry(lines[n - 1])) for n in range(first, last + 1)]
+        else:
+            labels = [None, *load_labels(path)]
+            with open(index_path(path), "rb") as idx:
+                idx.seek((first - 1) * RECORD.size)
+                records = idx.read(max(0, last - first + 1) * RECORD.size)
+            rows = []
+            for n, (segment, offset, type_id, by_id) in enumerate(RECORD.iter_unpack(records), first):
+                rows.append((n, labels[type_id], labels[by_id], (segment, offset)))
+        if filtered:
+            rows = [row for row in rows
+                    if (not args.type or row[1] in args.type) and (not args.by or row[2] in args.by)]
+        if args.tail is not None:
+            rows = rows[max(0, len(rows) - args.tail):] if args.tail else []
+        sealed = {}
+        matches = []
+        for n, entry_type, by, text in rows:
+            if layout is not None:  # `text` is still (segment, offset): read just that line
+                segment, offset = text
+                if segment < active_segment(layout[2]):
+                    if segment not in sealed:
+                        sealed[segment] = sealed_files.enter_context(
+                            open(segment_path(path, segment), "rb"))
+                    source = sealed[segment]
+                else:
+                    source, offset = f, layout[1] + offset
+                source.seek(offset)
+                text = parse_entry(source.readline().decode("utf-8").rstrip("\n"))[2]
+            matches.append({"n": n, "type": entry_type, "by": by, "text": text})
+    print(json.dumps({
+        "ok": True,
+        "memlog": str(path),
+        "entries": entries,
+        "matches": matches,
+    }, ensure_ascii=False))
     return 0
 
 
@@ -210,6 +674,22 @@ def main(argv: list[str] | None = None) -> int:
     pa.add_argument("--by", help="who the entry came from (e.g. user, coach); rendered into the tag")
     pa.set_defaults(func=cmd_append)
 
+    pb = sub.add_parser("append-batch", help="append many entries, in order, in one atomic write")
+    add_target(pb)
+    pb.add_argument(
+        "--file",
+        help='JSON lines of {"text": ..., "type": ..., "by": ...}; stdin when omitted or -',
+    )
+    pb.set_defaults(func=cmd_append_batch)
+
+    pq = sub.add_parser("query", help="read entries back through the offset index")
+    add_target(pq)
+    pq.add_argument("--type", action="append", help="only entries of this type (repeatable)")
+    pq.add_argument("--by", action="append", help="only entries by this author (repeatable)")
+    pq.add_argument("--range", metavar="START:END", help="entry numbers, 1-based and inclusive")
+    pq.add_argument("--tail", type=int, metavar="N", help="only the last N matching entries")
+    pq.set_defaults(func=cmd_query)
+
     pset = sub.add_parser("set", help="set a descriptive frontmatter field")
     add_target(pset)
     pset.add_argument("--key", required=True)
@@ -2,11 +2,21 @@
 # /// script
 # requires-python = ">=3.11"
 # ///
-"""Render a skill's Markdown sources into an immutable project snapshot."""
+"""Render a skill's Markdown sources into an immutable project snapshot.
+
+With one --skill the output is a single dispatch line. Repeated --skill, or
+--all for every installed skill whose SKILL.md runs this renderer, loads
+central config once and prints one JSON report of entries and timings.
+With --lazy only workflow.md is rendered up front; --source renders another
+source into the same generation on demand. --profile reports per-phase
+timings and whether the generation was reused or published.
+`render_skill.py gc` removes generations that are no longer in use.
+"""
 
 from __future__ import annotations
 
 import argparse
+import codecs
 import hashlib
 import json
 import os
@@ -14,23 +24,43 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 # Installed scripts are consumer files, not a location for interpreter caches.
 sys.dont_write_bytecode = True
 
-from config_utils import ConfigError, load_central_config, load_customization, load_toml
+from config_utils import (
+    ConfigError,
+    central_layers,
+    customization_layers,
+    fingerprint_settled,
+    load_central_config,
+    load_customization,
+    load_toml,
+)
 
 
 class RenderError(ValueError):
     """Raised when rendering cannot safely publish a snapshot."""
 
 
-_CONFIG_TOKEN = re.compile(r"\{\{config\.([A-Za-z0-9_.-]+)\}\}")
-_SHORT_CONFIG_TOKEN = re.compile(r"\{\{\.([A-Za-z0-9_]+)\}\}")
-_CUSTOM_TOKEN = re.compile(r"\{workflow\.([A-Za-z0-9_.-]+)\}")
-_SNAPSHOT_TOKEN = re.compile(r"\[\[bmad-snapshot:([A-Za-z0-9_./-]+\.md)\]\]")
+# Every render token in one alternation. Each kind has a distinct prefix and
+# no token body can contain another token's delimiters, so one left-to-right
+# scan finds exactly the tokens per-kind scans would.
+# Sources are scanned as bytes: token text is ASCII, so only matched tokens
+# are ever decoded.
+_TOKEN = re.compile(
+    rb"\{\{\.(?P<short>[A-Za-z0-9_]+)\}\}"
+    rb"|\{\{config\.(?P<config>[A-Za-z0-9_.-]+)\}\}"
+    rb"|\{workflow\.(?P<custom>[A-Za-z0-9_.-]+)\}"
+    rb"|\[\[bmad-snapshot:(?P<snapshot>[A-Za-z0-9_./-]+\.md)\]\]"
+)
+# Every token starts with one of these, so a file holding none is token-free.
+_TOKEN_PREFIXES = (b"{{", b"{workflow.", b"[[bmad-snapshot:")
+_TOKEN_PREFIX_OVERLAP = max(map(len, _TOKEN_PREFIXES)) - 1
 
 
 def _hash_bytes(content: bytes) -> str:
@@ -95,8 +125,66 @@ def _require_review_layers(value: Any, label: str) -> list[dict[str, str]]:
     return result
 
 
-def _load_sources(skill_dir: Path) -> dict[str, str]:
-    sources: dict[str, str] = {}
+# Sources at least this large are streamed: hashed and checked for tokens in
+# chunks, and copied through without being held in memory when token-free.
+_STREAM_MIN_BYTES = 1024 * 1024
+_CHUNK_BYTES = 1024 * 1024
+
+
+class _Passthrough:
+    """A large token-free source, known by path and digest rather than content."""
+
+    __slots__ = ("path", "digest")
+
+    def __init__(self, path: Path, digest: str) -> None:
+        self.path = path
+        self.digest = digest
+
+
+_Source = bytes | _Passthrough
+
+
+def _as_text(content: bytes) -> bytes:
+    """Sources are UTF-8 text with universal newlines, as a text-mode read gives them.
+
+    Validation runs chunk by chunk so no decoded copy of a large source is held.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(content)
+    for start in range(0, len(content), _CHUNK_BYTES):
+        decoder.decode(view[start : start + _CHUNK_BYTES])
+    decoder.decode(b"", final=True)
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return content
+
+
+def _read_source(path: Path) -> _Source:
+    with path.open("rb") as stream:
+        size = os.fstat(stream.fileno()).st_size
+        if size < _STREAM_MIN_BYTES:
+            return _as_text(stream.read())
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        digest = hashlib.sha256()
+        tail = b""
+        while chunk := stream.read(_CHUNK_BYTES):
+            seam = tail + chunk[:_TOKEN_PREFIX_OVERLAP]
+            if b"\r" in chunk or any(
+                prefix in chunk or prefix in seam for prefix in _TOKEN_PREFIXES
+            ):
+                # Tokens need match spans over the whole text, and newline
+                # normalization changes the bytes, so neither can pass through.
+                stream.seek(0)
+                return _as_text(stream.read())
+            decoder.decode(chunk)
+            digest.update(chunk)
+            tail = chunk[-_TOKEN_PREFIX_OVERLAP:]
+        decoder.decode(b"", final=True)
+    return _Passthrough(path, digest.hexdigest())
+
+
+def _load_sources(skill_dir: Path) -> dict[str, _Source]:
+    sources: dict[str, _Source] = {}
     for candidate in sorted(skill_dir.rglob("*.md")):
         if candidate.name == "SKILL.md":
             continue
@@ -107,7 +195,7 @@ def _load_sources(skill_dir: Path) -> dict[str, str]:
         if not path.is_file():
             raise RenderError(f"render source is missing or not a file: {path}")
         try:
-            sources[name] = path.read_text(encoding="utf-8")
+            sources[name] = _read_source(path)
         except (OSError, UnicodeError) as error:
             raise RenderError(f"failed to read render source {path}: {error}") from error
     if "workflow.md" not in sources:
@@ -125,22 +213,27 @@ def _resolve_config_value(value: Any, label: str, project_root: Path) -> str:
     return resolved
 
 
-def _find_config_values(data: Any, key: str, prefix: str = "") -> list[tuple[str, Any]]:
-    matches: list[tuple[str, Any]] = []
-    if not isinstance(data, dict):
-        return matches
-    for name, value in data.items():
-        path = f"{prefix}.{name}" if prefix else name
-        if name == key and not isinstance(value, (dict, list)):
-            matches.append((path, value))
-        matches.extend(_find_config_values(value, key, path))
-    return matches
+def _config_leaf_index(data: Any) -> dict[str, list[tuple[str, Any]]]:
+    """Map each scalar leaf name to its (dotted path, value) pairs, in document order."""
+    index: dict[str, list[tuple[str, Any]]] = {}
+
+    def visit(table: dict[str, Any], prefix: str) -> None:
+        for name, value in table.items():
+            path = f"{prefix}.{name}" if prefix else name
+            if isinstance(value, dict):
+                visit(value, path)
+            elif not isinstance(value, list):
+                index.setdefault(name, []).append((path, value))
+
+    if isinstance(data, dict):
+        visit(data, "")
+    return index
 
 
 def _resolve_short_config(
-    central: dict[str, Any], key: str, project_root: Path
+    leaf_index: dict[str, list[tuple[str, Any]]], key: str, project_root: Path
 ) -> tuple[str, str]:
-    matches = _find_config_values(central, key)
+    matches = leaf_index.get(key)
     if not matches:
         raise RenderError(f"missing config value `{key}`")
     if len(matches) > 1:
@@ -189,34 +282,57 @@ def _resolve_customization_value(value: Any, default: Any, label: str) -> tuple[
     raise RenderError(f"{label} has unsupported default type {type(default).__name__}")
 
 
+def _scan_tokens(sources: dict[str, _Source]) -> dict[str, list[re.Match[bytes]]]:
+    """Scan each source once; the matches are the spans substitution reuses."""
+    return {
+        name: [] if isinstance(content, _Passthrough) else list(_TOKEN.finditer(content))
+        for name, content in sources.items()
+    }
+
+
 def _resolve_replacements(
-    sources: dict[str, str],
+    tokens: dict[str, list[re.Match[bytes]]],
     central: dict[str, Any],
     customization: dict[str, Any],
     defaults: dict[str, Any] | None,
     project_root: Path,
-) -> tuple[dict[str, str], dict[str, Any]]:
-    replacements: dict[str, str] = {}
+) -> tuple[dict[bytes, str], dict[str, Any]]:
+    replacements: dict[bytes, str] = {}
     input_values: dict[str, Any] = {}
-    for content in sources.values():
-        for match in _SHORT_CONFIG_TOKEN.finditer(content):
-            token, key = match.group(0), match.group(1)
-            path, resolved = _resolve_short_config(central, key, project_root)
+    leaf_index: dict[str, list[tuple[str, Any]]] | None = None
+    for matches in tokens.values():
+        # Resolve kind by kind within a source so the first error reported
+        # does not depend on where tokens sit in the text; a repeated token
+        # resolves to the same value, so only its first occurrence is resolved.
+        for match in matches:
+            token = match.group(0)
+            if match.lastgroup != "short" or token in replacements:
+                continue
+            if leaf_index is None:
+                leaf_index = _config_leaf_index(central)
+            key = match.group("short").decode("ascii")
+            path, resolved = _resolve_short_config(leaf_index, key, project_root)
             source = f"config.{path}"
             replacements[token] = resolved
             input_values[source] = resolved
-        for match in _CONFIG_TOKEN.finditer(content):
-            token, path = match.group(0), match.group(1)
+        for match in matches:
+            token = match.group(0)
+            if match.lastgroup != "config" or token in replacements:
+                continue
+            path = match.group("config").decode("ascii")
             source = f"config.{path}"
             resolved = _resolve_config_value(
                 _lookup(central, path, "config value"), source, project_root
             )
             replacements[token] = resolved
             input_values[source] = resolved
-        for match in _CUSTOM_TOKEN.finditer(content):
+        for match in matches:
+            token = match.group(0)
+            if match.lastgroup != "custom" or token in replacements:
+                continue
             if defaults is None:
                 raise RenderError("customization tokens require customize.toml")
-            token, relative_path = match.group(0), match.group(1)
+            relative_path = match.group("custom").decode("ascii")
             path = f"workflow.{relative_path}"
             source = f"customization.{path}"
             resolved, rendered = _resolve_customization_value(
@@ -230,44 +346,146 @@ def _resolve_replacements(
 
 
 def _render_sources(
-    sources: dict[str, str], replacements: dict[str, str], destination: Path
-) -> dict[str, str]:
-    """Resolve only tokens authored in installed sources in one opaque pass."""
+    sources: dict[str, _Source],
+    tokens: dict[str, list[re.Match[bytes]]],
+    replacements: dict[bytes, str],
+    destination: Path,
+    names: list[str] | None = None,
+) -> dict[str, _Source]:
+    """Resolve only tokens authored in installed sources in one opaque pass.
+
+    `names` limits the pass to those sources; snapshot references may still
+    target any source, and those in every source are checked, so a partial
+    pass fails exactly when a full one would. A token-free source is
+    returned as the same object.
+    """
+    for matches in tokens.values():
+        for match in matches:
+            target = match.group("snapshot")
+            if target is not None and (target := target.decode("ascii")) not in sources:
+                raise RenderError(f"snapshot reference targets undeclared source: {target}")
     # Workflow customization may reference installed skill files; bind those
     # references to the immutable generation before inserting the prose.
-    replacements = {
-        token: value.replace("{skill-root}", str(destination))
-        if token.startswith("{workflow.")
-        else value
+    encoded = {
+        token: (
+            value.replace("{skill-root}", str(destination))
+            if token.startswith(b"{workflow.")
+            else value
+        ).encode("utf-8")
         for token, value in replacements.items()
     }
-    source_names = set(sources)
-    patterns = [
-        *(re.escape(token) for token in sorted(replacements, key=len, reverse=True)),
-        _SNAPSHOT_TOKEN.pattern,
-    ]
-    token_pattern = re.compile("|".join(patterns))
-
-    def replace(match: re.Match[str]) -> str:
-        token = match.group(0)
-        if token in replacements:
-            return replacements[token]
-        snapshot = _SNAPSHOT_TOKEN.fullmatch(token)
-        if snapshot is None:
-            raise RenderError(f"unsupported render token: {token}")
-        target = snapshot.group(1)
-        if target not in source_names:
-            raise RenderError(f"snapshot reference targets undeclared source: {target}")
-        return str(destination / target)
-
-    rendered: dict[str, str] = {}
-    for name, content in sources.items():
+    rendered: dict[str, _Source] = {}
+    for name in sources if names is None else names:
+        content = sources[name]
+        if not tokens[name]:
+            rendered[name] = content
+            continue
         # Inserted paths and customization prose are never scanned as source tokens.
-        rendered[name] = token_pattern.sub(replace, content)
+        pieces = []
+        position = 0
+        for match in tokens[name]:
+            target = match.group("snapshot")
+            if target is None:
+                value = encoded[match.group(0)]
+            else:
+                value = str(destination / target.decode("ascii")).encode("utf-8")
+            pieces.append(content[position : match.start()])
+            pieces.append(value)
+            position = match.end()
+        pieces.append(content[position:])
+        rendered[name] = b"".join(pieces)
     return rendered
 
 
-def _verify_existing(destination: Path, manifest: dict[str, Any]) -> None:
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Linux FICLONE ioctl: a copy-on-write clone on btrfs, XFS, and similar.
+_FICLONE = 0x40049409 if fcntl is not None and sys.platform.startswith("linux") else None
+
+# Hashing and writing release the GIL, so outputs beyond a handful are
+# spread over a few threads.
+_IO_THREADS = 8
+_IO_THREAD_MIN_FILES = 4
+
+
+def _map_io(function: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    """Apply `function` to every item on worker threads; exceptions are returned, not raised."""
+    results: list[Any] = [None] * len(items)
+    positions = iter(range(len(items)))
+
+    def work() -> None:
+        for position in positions:
+            try:
+                results[position] = function(items[position])
+            except Exception as error:  # reported by the caller in item order
+                results[position] = error
+
+    workers = min(_IO_THREADS, os.cpu_count() or 1, len(items))
+    if len(items) < _IO_THREAD_MIN_FILES or workers < 2:
+        work()
+        return results
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        while chunk := stream.read(_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _generation_files(destination: Path) -> set[str]:
+    files = set()
+    for directory, _, names in os.walk(destination):
+        relative = Path(directory).relative_to(destination)
+        files.update((relative / name).as_posix() for name in names)
+    return files
+
+
+def _seal_path(destination: Path) -> Path:
+    """Stat seal for a generation, kept beside it so the generation stays exact."""
+    return destination.with_name(f".{destination.name}.seal")
+
+
+def _seal(destination: Path, names: list[str]) -> list[list[Any]]:
+    seal = []
+    for name in names:
+        stat = (destination / name).stat()
+        seal.append([name, stat.st_mtime_ns, stat.st_size, stat.st_ino])
+    return seal
+
+
+def _write_seal(destination: Path, manifest: dict[str, Any]) -> None:
+    seal_path = _seal_path(destination)
+    staging = seal_path.with_name(f"{seal_path.name}.{os.getpid()}.tmp")
+    try:
+        seal = _seal(destination, [*manifest["outputs"], "manifest.json"])
+        staging.write_bytes(json.dumps(seal).encode("utf-8"))
+        os.replace(staging, seal_path)
+    except OSError:
+        staging.unlink(missing_ok=True)
+
+
+def _seal_holds(destination: Path, manifest: dict[str, Any]) -> bool:
+    try:
+        seal = json.loads(_seal_path(destination).read_bytes())
+        return seal == _seal(destination, [*manifest["outputs"], "manifest.json"])
+    except (OSError, ValueError):
+        return False
+
+
+def _verify_existing(
+    destination: Path, manifest: dict[str, Any], *, trust_seal: bool = False
+) -> None:
     manifest_path = destination / "manifest.json"
     try:
         existing = json.loads(manifest_path.read_text(encoding="utf-8"))
@@ -276,33 +494,132 @@ def _verify_existing(destination: Path, manifest: dict[str, Any]) -> None:
     if existing != manifest:
         raise RenderError(f"generation collision or corruption at {destination}")
     expected_files = set(manifest["outputs"]) | {"manifest.json"}
-    actual_files = {
-        path.relative_to(destination).as_posix()
-        for path in destination.rglob("*")
-        if path.is_file()
-    }
-    if actual_files != expected_files:
+    # A lazy generation may also hold any of its deferred sources.
+    files = _generation_files(destination)
+    if not expected_files <= files or files - expected_files - set(manifest.get("deferred", ())):
         raise RenderError(f"generation contains unexpected or missing files: {destination}")
-    for name, expected_hash in manifest["outputs"].items():
-        try:
-            actual_hash = _hash_bytes((destination / name).read_bytes())
-        except OSError as error:
-            raise RenderError(f"failed to verify {destination / name}: {error}") from error
-        if actual_hash != expected_hash:
+    if trust_seal and _seal_holds(destination, manifest):
+        return
+    names = list(manifest["outputs"])
+    hashes = _map_io(_hash_file, [destination / name for name in names])
+    for name, actual_hash in zip(names, hashes):
+        if isinstance(actual_hash, OSError):
+            raise RenderError(
+                f"failed to verify {destination / name}: {actual_hash}"
+            ) from actual_hash
+        if isinstance(actual_hash, Exception):
+            raise actual_hash
+        if actual_hash != manifest["outputs"][name]:
             raise RenderError(f"generation output hash mismatch: {destination / name}")
+    if trust_seal:
+        _write_seal(destination, manifest)
+
+
+def _previous_outputs(namespace: Path, limit: int = 8) -> dict[str, Path]:
+    """Output hash -> file in the `limit` most recent generations of a namespace."""
+    generations = []
+    try:
+        with os.scandir(namespace) as entries:
+            for entry in entries:
+                if not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False):
+                    generations.append((entry.stat().st_mtime_ns, Path(entry.path)))
+    except OSError:
+        return {}
+    previous: dict[str, Path] = {}
+    for _, generation in sorted(generations, reverse=True)[:limit]:
+        try:
+            manifest = json.loads((generation / "manifest.json").read_bytes())
+            for name, digest in manifest["outputs"].items():
+                previous.setdefault(digest, generation / name)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            continue
+    return previous
+
+
+def _clone(source: Path, path: Path) -> bool:
+    """Share an identical earlier output: hardlink, else reflink; False if neither works."""
+    try:
+        os.link(source, path)
+        return True
+    except OSError:
+        pass
+    if _FICLONE is None:
+        return False
+    try:
+        with source.open("rb") as src, path.open("xb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        path.unlink(missing_ok=True)
+        return False
+
+
+def _write_new(item: tuple[Path, _Source, str, Path | None]) -> None:
+    path, content, digest, previous = item
+    if previous is not None:
+        try:
+            # Only bytes that still match may be shared; a damaged earlier
+            # generation must not leak into this one.
+            if _hash_file(previous) == digest and _clone(previous, path):
+                return
+        except OSError:
+            pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        if isinstance(content, _Passthrough):
+            _copy_source(content, fd)
+            return
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _copy_source(source: _Passthrough, fd: int) -> None:
+    """Stream a passthrough source into `fd`, checking it still has the digest it was named by."""
+    digest = hashlib.sha256()
+    with source.path.open("rb") as stream:
+        while chunk := stream.read(_CHUNK_BYTES):
+            digest.update(chunk)
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view) :]
+    if digest.hexdigest() != source.digest:
+        raise RenderError(f"render source changed while rendering: {source.path}")
 
 
-def _publish(destination: Path, outputs: dict[str, bytes], manifest: dict[str, Any]) -> None:
+def _write_outputs(
+    staging: Path, outputs: dict[str, _Source], output_hashes: dict[str, str]
+) -> None:
+    """Create every output directory once, then write or share the files concurrently."""
+    for directory in sorted({(staging / name).parent for name in outputs}):
+        directory.mkdir(parents=True, exist_ok=True)
+    previous = _previous_outputs(staging.parent)
+    items = [
+        (staging / name, content, output_hashes[name], previous.get(output_hashes[name]))
+        for name, content in outputs.items()
+    ]
+    for result in _map_io(_write_new, items):
+        if isinstance(result, Exception):
+            raise result
+
+
+def _publish(
+    destination: Path,
+    outputs: dict[str, _Source],
+    manifest: dict[str, Any],
+    *,
+    trust_seal: bool = False,
+) -> bool:
+    """Publish `destination`, or verify the copy already there; True if this call published it."""
     destination.parent.mkdir(parents=True, exist_ok=True)
     if destination.exists():
-        _verify_existing(destination, manifest)
-        return
+        _verify_existing(destination, manifest, trust_seal=trust_seal)
+        return False
     staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=destination.parent))
     try:
-        for name, content in outputs.items():
-            path = staging / name
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(content)
+        _write_outputs(staging, outputs, manifest["outputs"])
         (staging / "manifest.json").write_bytes(
             json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
             + b"\n"
@@ -311,25 +628,304 @@ def _publish(destination: Path, outputs: dict[str, bytes], manifest: dict[str, A
             os.rename(staging, destination)
         except OSError:
             if destination.exists():
-                _verify_existing(destination, manifest)
-            else:
-                raise
+                _verify_existing(destination, manifest, trust_seal=trust_seal)
+                return False
+            raise
+        if trust_seal:
+            _write_seal(destination, manifest)
+        return True
     finally:
         if staging.exists():
             shutil.rmtree(staging, ignore_errors=True)
 
 
-def render(project_root: Path, skill_dir: Path) -> Path:
+def _materialize(destination: Path, name: str, content: _Source, digest: str) -> Path:
+    """Add a deferred source to a published lazy generation, or check the copy it holds."""
+    path = destination / name
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=destination.parent))
+        try:
+            _write_new((staging / "output", content, digest, None))
+            # link() never replaces, so concurrent materializations cannot clobber each other.
+            os.link(staging / "output", path)
+            return path
+        except FileExistsError:
+            pass
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    try:
+        actual_hash = _hash_file(path)
+    except OSError as error:
+        raise RenderError(f"failed to verify {path}: {error}") from error
+    if actual_hash != digest:
+        raise RenderError(f"generation output hash mismatch: {path}")
+    return path
+
+
+# Per-namespace record of the last published generation and the stats of
+# everything that produced it, so unchanged launches skip rendering.
+_INDEX_NAME = ".index.json"
+_INDEX_VERSION = 1
+
+
+def _stat_paths(paths: list[Path]) -> list[list[Any]]:
+    stats = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            stats.append([str(path), None])
+        else:
+            stats.append([str(path), [stat.st_mtime_ns, stat.st_size, stat.st_ino]])
+    return stats
+
+
+def _input_paths(project_root: Path, skill_dir: Path, source_names: list[str]) -> list[Path]:
+    """Every file and directory whose change could change the rendered generation."""
+    renderer = Path(__file__)
+    paths = [renderer, renderer.with_name("config_utils.py")]
+    paths.extend(path for path, _ in central_layers(project_root))
+    paths.extend(path for path, _ in customization_layers(project_root, skill_dir))
+    # Directory mtimes move when a source is added, removed, or renamed.
+    paths.extend(Path(directory) for directory, _, _ in os.walk(skill_dir))
+    paths.extend(skill_dir / name for name in source_names)
+    return paths
+
+
+def _indexed_generation(index_path: Path, skill_dir: Path, lazy: bool = False) -> Path | None:
+    """The indexed generation's workflow.md while no input or output changed.
+
+    Namespaces are keyed by skill name, so same-named skills installed in
+    different directories share an index; only the one that wrote it may use it.
+    """
+    try:
+        index = json.loads(index_path.read_bytes())
+        if index.get("version") != _INDEX_VERSION or index.get("lazy", False) != lazy:
+            return None
+        if index.get("skill_dir") != str(skill_dir):
+            return None
+        inputs = index["inputs"]
+        if not fingerprint_settled(inputs, index["recorded_ns"]):
+            return None
+        paths = [Path(path) for path, _ in inputs]
+        if _stat_paths(paths) != inputs:
+            return None
+        # An edited output must reach _verify_existing, never dispatch.
+        outputs = index["outputs"]
+        if _stat_paths([Path(path) for path, _ in outputs]) != outputs:
+            return None
+        return Path(index["entry"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _indexed_entry(index_path: Path) -> Path | None:
+    """The generation an index points at, whether or not its inputs still hold."""
+    try:
+        return Path(json.loads(index_path.read_bytes())["entry"]).parent
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_index(index_path: Path, index: dict[str, Any]) -> None:
+    staging = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    try:
+        staging.write_bytes(json.dumps(index).encode("utf-8"))
+        os.replace(staging, index_path)
+    except OSError:
+        staging.unlink(missing_ok=True)
+
+
+def _mark_used(generation: Path) -> None:
+    """Stamp a dispatched generation's directory mtime; `gc` treats it as last use."""
+    try:
+        os.utime(generation)
+    except OSError:
+        pass
+
+
+# Generations dispatched this recently are never collected: an agent may be
+# reading one that a newer render has just superseded.
+_GC_GRACE_NS = 15 * 60 * 1_000_000_000
+_GENERATION_NAME = re.compile(r"[0-9a-f]{20}")
+
+
+def _generations(namespace: Path) -> list[tuple[int, Path]]:
+    """(last use, path) for every published generation, most recent first."""
+    generations = []
+    with os.scandir(namespace) as entries:
+        for entry in entries:
+            if (
+                _GENERATION_NAME.fullmatch(entry.name)
+                and entry.is_dir(follow_symlinks=False)
+                and os.path.isfile(os.path.join(entry.path, "manifest.json"))
+            ):
+                generations.append((entry.stat(follow_symlinks=False).st_mtime_ns, Path(entry.path)))
+    return sorted(generations, reverse=True)
+
+
+def _freed_bytes(trees: list[Path]) -> int:
+    """Bytes freed by deleting `trees`; an inode still linked from elsewhere frees nothing."""
+    links: dict[tuple[int, int], list[int]] = {}
+    for tree in trees:
+        for directory, _, names in os.walk(tree):
+            for name in names:
+                try:
+                    stat = os.stat(os.path.join(directory, name), follow_symlinks=False)
+                except OSError:
+                    continue
+                seen = links.setdefault((stat.st_dev, stat.st_ino), [0, stat.st_nlink, stat.st_size])
+                seen[0] += 1
+    return sum(size for count, nlink, size in links.values() if count >= nlink)
+
+
+def collect_garbage(
+    project_root: Path, *, keep: int = 2, skill: str | None = None
+) -> dict[str, Any]:
+    """Remove all but the `keep` most recently used generations per namespace.
+
+    The indexed generation and anything used within the grace period are
+    always kept. Doomed generations are first renamed into a trash directory,
+    so a concurrent render sees them absent and republishes rather than
+    reading a half-deleted tree. `skill` limits collection to one skill's
+    directory under `_bmad/render/`.
+    """
+    if skill is not None and (
+        not skill or skill.startswith(".") or any(char in skill for char in "/\\*?[")
+    ):
+        raise RenderError(f"skill must be a skill name, not a path or pattern: {skill}")
+    render_root = project_root.resolve(strict=True) / "_bmad" / "render"
+    cutoff = time.time_ns() - _GC_GRACE_NS
+    if skill is not None:
+        skill_roots = [render_root / skill]
+    elif render_root.is_dir():
+        skill_roots = list(render_root.iterdir())
+    else:
+        skill_roots = []
+    namespaces = sorted(
+        namespace
+        for skill_root in skill_roots
+        if skill_root.is_dir() and not skill_root.name.startswith(".")
+        for namespace in skill_root.iterdir()
+        if namespace.is_dir() and not namespace.name.startswith(".")
+    )
+    removed: list[str] = []
+    kept = 0
+    doomed: list[tuple[Path, Path]] = []
+    for namespace in namespaces:
+        indexed = _indexed_entry(namespace / _INDEX_NAME)
+        for position, (used_ns, generation) in enumerate(_generations(namespace)):
+            if position < keep or used_ns >= cutoff or generation == indexed:
+                kept += 1
+            else:
+                doomed.append((namespace, generation))
+        for entry in namespace.iterdir():
+            # Abandoned staging from a crashed render, or trash from a crashed gc.
+            if entry.name.startswith((".staging-", ".trash-")) and entry.is_dir():
+                if entry.name.startswith(".trash-") or entry.stat().st_mtime_ns < cutoff:
+                    doomed.append((namespace, entry))
+    trash_dirs: dict[Path, Path] = {}
+    moved: list[Path] = []
+    for namespace, generation in doomed:
+        if generation.name.startswith(".trash-"):
+            moved.append(generation)
+            continue
+        if namespace not in trash_dirs:
+            trash_dirs[namespace] = Path(tempfile.mkdtemp(prefix=".trash-", dir=namespace))
+        target = trash_dirs[namespace] / generation.name
+        try:
+            os.rename(generation, target)
+        except OSError:
+            continue
+        _seal_path(generation).unlink(missing_ok=True)
+        if not generation.name.startswith("."):
+            removed.append(str(generation))
+    moved.extend(trash_dirs.values())
+    freed = _freed_bytes(moved)
+    for tree in moved:
+        shutil.rmtree(tree, ignore_errors=True)
+    return {"removed": removed, "kept": kept, "bytes_reclaimed": freed}
+
+
+class _Phases:
+    """Wall time per render phase in milliseconds, summed when a phase recurs."""
+
+    __slots__ = ("times", "_mark")
+
+    def __init__(self) -> None:
+        self.times: dict[str, float] = {}
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + (now - self._mark) * 1000
+        self._mark = now
+
+    def report(self, profile: dict[str, Any] | None, outcome: str) -> None:
+        if profile is not None:
+            profile["outcome"] = outcome
+            profile["phases"] = {phase: round(ms, 3) for phase, ms in self.times.items()}
+
+
+def render(
+    project_root: Path,
+    skill_dir: Path,
+    *,
+    central: dict[str, Any] | None = None,
+    trust_seal: bool = False,
+    lazy: bool = False,
+    source: str | None = None,
+    profile: dict[str, Any] | None = None,
+) -> Path:
+    """Publish (or reuse) the skill's generation and return its workflow.md.
+
+    Batch callers pass `central`, the project's merged central config, to
+    share one load across skills. With `trust_seal`, an existing generation
+    whose output stats match the seal recorded at its last full verification
+    is reused without re-hashing.
+
+    A `lazy` generation publishes only workflow.md; every other source is
+    listed as deferred and rendered into the same generation when requested
+    as `source`, whose rendered path is then returned. Every token is still
+    resolved up front, so a lazy render fails exactly when an eager one would.
+
+    A `profile` dict receives per-phase timings and the outcome: "indexed"
+    (dispatched from the index), "verified" (an existing generation was
+    checked and reused), or "published".
+    """
+    phases = _Phases()
+    lazy = lazy or source is not None
     project_root = project_root.resolve(strict=True)
     skill_dir = skill_dir.resolve(strict=True)
     if not (project_root / "_bmad").is_dir():
         raise RenderError(f"project root does not contain _bmad/: {project_root}")
 
+    root_hash = _hash_bytes(str(project_root).encode("utf-8"))[:12]
+    slug = re.sub(r"[^a-z0-9]+", "-", project_root.name.lower()).strip("-") or "project"
+    slug = slug[:80].rstrip("-") or "project"
+    namespace = project_root / "_bmad" / "render" / skill_dir.name / f"{slug}-{root_hash}"
+    index_path = namespace / _INDEX_NAME
+    indexed = None if source is not None else _indexed_generation(index_path, skill_dir, lazy)
+    phases.lap("index")
+    if indexed is not None:
+        _mark_used(indexed.parent)
+        phases.report(profile, "indexed")
+        return indexed
+    recorded_ns = time.time_ns()
+
     sources = _load_sources(skill_dir)
-    central = load_central_config(project_root)
+    if source is not None and source not in sources:
+        raise RenderError(f"render source is not declared: {source}")
+    phases.lap("load")
+    if central is None:
+        central = load_central_config(project_root)
+    phases.lap("config")
+    tokens = _scan_tokens(sources)
     has_customization = any(
-        _CUSTOM_TOKEN.search(content) for content in sources.values()
+        match.lastgroup == "custom" for matches in tokens.values() for match in matches
     )
+    phases.lap("tokens")
     defaults = (
         load_toml(skill_dir / "customize.toml", required=True)
         if has_customization
@@ -338,15 +934,15 @@ def render(project_root: Path, skill_dir: Path) -> Path:
     customization = (
         load_customization(project_root, skill_dir) if has_customization else {}
     )
+    phases.lap("config")
     replacements, input_values = _resolve_replacements(
-        sources, central, customization, defaults, project_root
+        tokens, central, customization, defaults, project_root
     )
+    phases.lap("tokens")
     source_hashes = {
-        name: _hash_bytes(content.encode("utf-8")) for name, content in sources.items()
+        name: content.digest if isinstance(content, _Passthrough) else _hash_bytes(content)
+        for name, content in sources.items()
     }
-    root_hash = _hash_bytes(str(project_root).encode("utf-8"))[:12]
-    slug = re.sub(r"[^a-z0-9]+", "-", project_root.name.lower()).strip("-") or "project"
-    slug = slug[:80].rstrip("-") or "project"
     renderer_hash = _hash_bytes(Path(__file__).read_bytes())
     identity = {
         "project_root": str(project_root),
@@ -354,19 +950,20 @@ def render(project_root: Path, skill_dir: Path) -> Path:
         "resolved_values": input_values,
         "source_sha256": source_hashes,
     }
+    if lazy:
+        identity["materialization"] = "lazy"
     generation_hash = _hash_bytes(_canonical_json(identity))[:20]
-    destination = (
-        project_root
-        / "_bmad"
-        / "render"
-        / skill_dir.name
-        / f"{slug}-{root_hash}"
-        / generation_hash
-    )
-    rendered = _render_sources(sources, replacements, destination)
-    outputs = {name: content.encode("utf-8") for name, content in rendered.items()}
-    output_hashes = {name: _hash_bytes(content) for name, content in outputs.items()}
-    manifest = {
+    destination = namespace / generation_hash
+    phases.lap("hash")
+    eager = ["workflow.md"] if lazy else None
+    outputs = _render_sources(sources, tokens, replacements, destination, eager)
+    phases.lap("substitute")
+    # A token-free output is its source, already hashed.
+    output_hashes = {
+        name: source_hashes[name] if content is sources[name] else _hash_bytes(content)
+        for name, content in outputs.items()
+    }
+    manifest: dict[str, Any] = {
         "schema_version": 1,
         "skill": skill_dir.name,
         "project_root": str(project_root),
@@ -376,25 +973,287 @@ def render(project_root: Path, skill_dir: Path) -> Path:
         "inputs": identity,
         "outputs": output_hashes,
     }
-    _publish(destination, outputs, manifest)
-    return destination / "workflow.md"
+    if lazy:
+        manifest["deferred"] = sorted(set(sources) - set(outputs))
+    phases.lap("hash")
+    published = _publish(destination, outputs, manifest, trust_seal=trust_seal)
+    _mark_used(destination)
+    entry = destination / "workflow.md"
+    if source is not None and source not in outputs:
+        content = _render_sources(sources, tokens, replacements, destination, [source])[source]
+        digest = source_hashes[source] if content is sources[source] else _hash_bytes(content)
+        entry = _materialize(destination, source, content, digest)
+    phases.lap("publish")
+    _write_index(
+        index_path,
+        {
+            "version": _INDEX_VERSION,
+            "skill_dir": str(skill_dir),
+            "lazy": lazy,
+            "recorded_ns": recorded_ns,
+            "inputs": _stat_paths(_input_paths(project_root, skill_dir, list(sources))),
+            "outputs": _stat_paths(
+                [destination / name for name in [*outputs, "manifest.json"]]
+            ),
+            "entry": str(destination / "workflow.md"),
+        },
+    )
+    phases.lap("index")
+    phases.report(profile, "published" if published else "verified")
+    return entry
+
+
+# Skills whose sources total this much are rendered in worker processes.
+_POOL_SOURCE_BYTES = 8 * 1024 * 1024
+# Directories under _bmad/ that hold renderer state rather than skills.
+_NON_SKILL_DIRS = {".cache", "custom", "render", "scripts"}
+
+
+def discover_rendered_skills(project_root: Path) -> list[Path]:
+    """Installed skills, under _bmad/ or an IDE's `.<tool>/skills/`, that run this renderer."""
+    candidates = []
+    for directory, subdirs, files in os.walk(project_root / "_bmad"):
+        subdirs[:] = sorted(name for name in subdirs if name not in _NON_SKILL_DIRS)
+        if "SKILL.md" in files:
+            candidates.append(Path(directory) / "SKILL.md")
+    candidates.extend(sorted(project_root.glob(".*/skills/*/SKILL.md")))
+    skills: dict[Path, None] = {}
+    for skill_md in candidates:
+        try:
+            if "render_skill.py" in skill_md.read_text(encoding="utf-8"):
+                skills[skill_md.parent.resolve()] = None
+        except (OSError, UnicodeError):
+            continue
+    return list(skills)
+
+
+def _source_bytes(skill_dir: Path) -> int:
+    total = 0
+    for path in skill_dir.rglob("*.md"):
+        try:
+            total += path.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _timed_render(
+    project_root: Path,
+    skill_dir: Path,
+    central: dict[str, Any],
+    trust_seal: bool,
+    profile: bool = False,
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    report: dict[str, Any] = {"skill": str(skill_dir)}
+    phases: dict[str, Any] | None = {} if profile else None
+    try:
+        report["entry"] = str(
+            render(
+                project_root, skill_dir, central=central, trust_seal=trust_seal, profile=phases
+            )
+        )
+    except (ConfigError, RenderError, OSError, UnicodeError, ValueError) as error:
+        report["error"] = str(error)
+    report["ms"] = round((time.perf_counter() - start) * 1000, 3)
+    if phases:
+        report.update(phases)
+    return report
+
+
+def render_many(
+    project_root: Path,
+    skill_dirs: list[Path],
+    *,
+    trust_seal: bool = False,
+    profile: bool = False,
+) -> dict[str, Any]:
+    """Render every skill against one central config load; failures are reported, not raised."""
+    start = time.perf_counter()
+    project_root = project_root.resolve(strict=True)
+    central = load_central_config(project_root)
+    if len(skill_dirs) > 1 and sum(map(_source_bytes, skill_dirs)) >= _POOL_SOURCE_BYTES:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(skill_dirs), os.cpu_count() or 1)
+        # Spawned workers never inherit config_utils' loader threads mid-fork.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            reports = list(
+                pool.map(
+                    _timed_render,
+                    [project_root] * len(skill_dirs),
+                    skill_dirs,
+                    [central] * len(skill_dirs),
+                    [trust_seal] * len(skill_dirs),
+                    [profile] * len(skill_dirs),
+                )
+            )
+    else:
+        reports = [
+            _timed_render(project_root, skill_dir, central, trust_seal, profile)
+            for skill_dir in skill_dirs
+        ]
+    return {"skills": reports, "ms": round((time.perf_counter() - start) * 1000, 3)}
+
+
+# Rolling log of profiled renders, one JSON object per line. Past the byte
+# cap it is rewritten with its newer half; a render appending during that
+# rewrite may lose its line, which is acceptable for statistics.
+_STATS_NAME = ".stats.jsonl"
+_STATS_MAX_BYTES = 256 * 1024
+
+
+def record_stats(project_root: Path, reports: list[dict[str, Any]]) -> None:
+    """Append profiled renders to `_bmad/render/.stats.jsonl`; failures are ignored."""
+    stats_path = project_root / "_bmad" / "render" / _STATS_NAME
+    renderer = _hash_file(Path(__file__))[:12]
+    at = round(time.time(), 3)
+    lines = b"".join(
+        json.dumps({"at": at, "renderer": renderer, **report}, ensure_ascii=False).encode("utf-8")
+        + b"\n"
+        for report in reports
+    )
+    try:
+        stats_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(stats_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            os.write(fd, lines)
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        if size > _STATS_MAX_BYTES:
+            kept = stats_path.read_bytes().splitlines(keepends=True)
+            staging = stats_path.with_name(f"{_STATS_NAME}.{os.getpid()}.tmp")
+            staging.write_bytes(b"".join(kept[len(kept) // 2 :]))
+            os.replace(staging, stats_path)
+    except OSError:
+        pass
+
+
+def _gc_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="render_skill.py gc",
+        description="Remove old render generations, keeping recent and indexed ones.",
+    )
+    parser.add_argument("--project-root", required=True)
+    parser.add_argument("--skill", help="Only collect this skill's generations (skill name)")
+    parser.add_argument(
+        "--keep",
+        type=int,
+        default=2,
+        help="Most recently used generations to keep per skill and project (default 2)",
+    )
+    args = parser.parse_args(argv)
+    if args.keep < 0:
+        parser.error("--keep must not be negative")
+    try:
+        report = collect_garbage(Path(args.project_root), keep=args.keep, skill=args.skill)
+    except (OSError, RenderError) as error:
+        sys.stderr.write(f"error: {error}\n")
+        return 1
+    sys.stdout.write(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    return 0
 
 
 def main() -> int:
+    if sys.argv[1:2] == ["gc"]:
+        return _gc_main(sys.argv[2:])
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--project-root", required=True)
-    parser.add_argument("--skill", required=True)
+    parser.add_argument(
+        "--skill", action="append", default=[], help="Skill directory to render (repeatable)"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Render every installed skill whose SKILL.md runs this renderer",
+    )
+    parser.add_argument(
+        "--trust-seal",
+        action="store_true",
+        help="Reuse an existing generation whose output stats match its seal without re-hashing",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Publish workflow.md now and render other sources when requested with --source",
+    )
+    parser.add_argument(
+        "--source",
+        help="Render this deferred source (path relative to the skill) into a lazy generation",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report per-phase timings and the outcome (JSON on stderr for one skill, "
+        "in the report for a batch) and append them to _bmad/render/.stats.jsonl",
+    )
     args = parser.parse_args()
+    if not args.skill and not args.all:
+        parser.error("one of --skill or --all is required")
+    if (args.lazy or args.source) and (len(args.skill) != 1 or args.all):
+        parser.error("--lazy and --source take exactly one --skill")
     reconfigure = getattr(sys.stdout, "reconfigure", None)
     if reconfigure is not None:
         reconfigure(encoding="utf-8")
+    project_root = Path(args.project_root)
+    if len(args.skill) == 1 and not args.all:
+        start = time.perf_counter()
+        profile: dict[str, Any] | None = {} if args.profile else None
+        try:
+            entry = render(
+                project_root,
+                Path(args.skill[0]),
+                trust_seal=args.trust_seal,
+                lazy=args.lazy,
+                source=args.source,
+                profile=profile,
+            )
+        except (ConfigError, RenderError, OSError, UnicodeError, ValueError) as error:
+            sys.stdout.write(f"HALT: {error}\n")
+            return 1
+        if profile is not None:
+            report = {
+                "skill": str(Path(args.skill[0]).resolve()),
+                "ms": round((time.perf_counter() - start) * 1000, 3),
+                **profile,
+            }
+            sys.stderr.write(json.dumps(report, ensure_ascii=False) + "\n")
+            record_stats(project_root.resolve(), [report])
+        if args.source is not None:
+            sys.stdout.write(f"{entry}\n")
+            return 0
+        sys.stdout.write(f"read and follow {entry}\n")
+        if args.lazy:
+            sys.stdout.write(
+                f"Files under {entry.parent} other than workflow.md are rendered on demand: "
+                "before reading one that does not exist yet, run the same command with "
+                "--source <path relative to that directory> added.\n"
+            )
+        return 0
+
     try:
-        entry = render(Path(args.project_root), Path(args.skill))
+        skill_dirs = list(dict.fromkeys(Path(skill).resolve(strict=True) for skill in args.skill))
+        if args.all:
+            skill_dirs.extend(
+                skill
+                for skill in discover_rendered_skills(project_root.resolve(strict=True))
+                if skill not in skill_dirs
+            )
+        report = render_many(
+            project_root, skill_dirs, trust_seal=args.trust_seal, profile=args.profile
+        )
     except (ConfigError, RenderError, OSError, UnicodeError, ValueError) as error:
         sys.stdout.write(f"HALT: {error}\n")
         return 1
-    sys.stdout.write(f"read and follow {entry}\n")
-    return 0
+    if args.profile:
+        record_stats(
+            project_root.resolve(), [skill for skill in report["skills"] if "error" not in skill]
+        )
+    sys.stdout.write(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    return 1 if any("error" in entry for entry in report["skills"]) else 0
 
 
 if __name__ == "__main__":
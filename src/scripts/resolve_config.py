@@ -2,7 +2,10 @@
 # /// script
 # requires-python = ">=3.11"
 # ///
-"""Resolve BMad's four central TOML layers to JSON."""
+"""Resolve BMad's four central TOML layers to JSON.
+
+When a resolver daemon is listening for the project, it answers instead.
+"""
 
 import argparse
 import json
@@ -13,7 +16,8 @@ from pathlib import Path
 sys.dont_write_bytecode = True
 
 try:
-    from config_utils import ConfigError, load_central_config
+    from config_utils import ConfigError, explain_central_config, load_central_keys
+    from resolver_daemon import query_daemon
 except ModuleNotFoundError as error:
     if error.name != "tomllib":
         raise
@@ -21,19 +25,6 @@ except ModuleNotFoundError as error:
     raise SystemExit(3) from None
 
 
-_MISSING = object()
-
-
-def extract_key(data, dotted_key: str):
-    current = data
-    for part in dotted_key.split("."):
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
-            return _MISSING
-    return current
-
-
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Resolve BMad central config using four-layer TOML merge."
@@ -51,21 +42,34 @@ def main() -> int:
         default=[],
         help="Dotted field path to resolve (repeatable). Omit for full dump.",
     )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help='Wrap output as {"resolved": ..., "explain": {path: layer file}}.',
+    )
     args = parser.parse_args()
 
+    project_root = Path(args.project_root).resolve()
+    reply = None
+    if not args.explain:
+        reply = query_daemon(project_root, {"op": "config", "keys": args.key})
+    if reply is not None:
+        if not reply["ok"]:
+            sys.stderr.write(f"error: {reply['error']}\n")
+            return 1
+        sys.stdout.write(json.dumps(reply["result"], indent=2, ensure_ascii=False) + "\n")
+        return 0
+
     try:
-        merged = load_central_config(Path(args.project_root).resolve())
+        if args.explain:
+            output = explain_central_config(project_root, args.key)
+        else:
+            # Keyed lookups merge only the requested paths.
+            output = load_central_keys(project_root, args.key)
     except ConfigError as error:
         sys.stderr.write(f"error: {error}\n")
         return 1
 
-    output = merged
-    if args.key:
-        output = {}
-        for key in args.key:
-            value = extract_key(merged, key)
-            if value is not _MISSING:
-                output[key] = value
     sys.stdout.write(json.dumps(output, indent=2, ensure_ascii=False) + "\n")
     return 0
 
@@ -2,7 +2,11 @@
 # /// script
 # requires-python = ">=3.11"
 # ///
-"""Resolve a skill's default, team, and user TOML customization layers."""
+"""Resolve a skill's default, team, and user TOML customization layers.
+
+Repeat `--skill`, or pass `--skills-root`, to resolve many skills in one
+process; the output is then one JSON object keyed by skill name.
+"""
 
 import argparse
 import json
@@ -13,7 +17,14 @@ from pathlib import Path
 sys.dont_write_bytecode = True
 
 try:
-    from config_utils import ConfigError, load_customization
+    from config_utils import (
+        ConfigError,
+        discover_skills,
+        explain_customization,
+        list_custom_dir,
+        load_customization_keys,
+    )
+    from resolver_daemon import query_daemon
 except ModuleNotFoundError as error:
     if error.name != "tomllib":
         raise
@@ -21,9 +32,6 @@ except ModuleNotFoundError as error:
     raise SystemExit(3) from None
 
 
-_MISSING = object()
-
-
 def find_project_root(start: Path) -> Path | None:
     current = start.resolve()
     while True:
@@ -34,16 +42,6 @@ def find_project_root(start: Path) -> Path | None:
         current = current.parent
 
 
-def extract_key(data, dotted_key: str):
-    current = data
-    for part in dotted_key.split("."):
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
-            return _MISSING
-    return current
-
-
 def write_json_stdout(output) -> None:
     reconfigure = getattr(sys.stdout, "reconfigure", None)
     if reconfigure is not None:
@@ -56,7 +54,17 @@ def main() -> int:
         description="Resolve skill customization using three-layer TOML merge."
     )
     parser.add_argument(
-        "--skill", "-s", required=True, help="Absolute path to the skill directory"
+        "--skill",
+        "-s",
+        action="append",
+        default=[],
+        help="Absolute path to the skill directory (repeatable)",
+    )
+    parser.add_argument(
+        "--skills-root",
+        action="append",
+        default=[],
+        help="Resolve every skill with a customize.toml under this directory (repeatable)",
     )
     parser.add_argument(
         "--project-root",
@@ -70,27 +78,70 @@ def main() -> int:
         default=[],
         help="Dotted field path to resolve (repeatable). Omit for full dump.",
     )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help='Wrap each result as {"resolved": ..., "explain": {path: layer file}}.',
+    )
     args = parser.parse_args()
+    if not args.skill and not args.skills_root:
+        parser.error("one of --skill or --skills-root is required")
 
-    skill_dir = Path(args.skill).resolve()
-    project_root = (
-        Path(args.project_root).resolve()
-        if args.project_root
-        else find_project_root(skill_dir) or find_project_root(Path.cwd())
-    )
+    skill_dirs = [Path(skill).resolve() for skill in args.skill]
     try:
-        merged = load_customization(project_root, skill_dir)
+        for skills_root in args.skills_root:
+            skill_dirs.extend(discover_skills(Path(skills_root).resolve()))
     except ConfigError as error:
         sys.stderr.write(f"error: {error}\n")
         return 1
+    batch = len(args.skill) != 1 or bool(args.skills_root)
+    project_root = (
+        Path(args.project_root).resolve()
+        if args.project_root
+        else next(
+            (root for root in map(find_project_root, skill_dirs) if root is not None),
+            None,
+        )
+        or find_project_root(Path.cwd())
+    )
 
-    output = merged
-    if args.key:
-        output = {}
-        for key in args.key:
-            value = extract_key(merged, key)
-            if value is not _MISSING:
-                output[key] = value
+    resolve = explain_customization if args.explain else load_customization_keys
+
+    if not batch:
+        if project_root is not None and not args.explain:
+            reply = query_daemon(
+                project_root,
+                {"op": "customization", "skill": str(skill_dirs[0]), "keys": args.key},
+            )
+            if reply is not None:
+                if not reply["ok"]:
+                    sys.stderr.write(f"error: {reply['error']}\n")
+                    return 1
+                write_json_stdout(reply["result"])
+                return 0
+        try:
+            # Keyed lookups merge only the requested paths.
+            output = resolve(project_root, skill_dirs[0], args.key)
+        except ConfigError as error:
+            sys.stderr.write(f"error: {error}\n")
+            return 1
+        write_json_stdout(output)
+        return 0
+
+    # One listing of _bmad/custom/ serves every skill's override lookup.
+    custom_listing = list_custom_dir(project_root)
+    output = {}
+    for skill_dir in skill_dirs:
+        if skill_dir.name in output:
+            sys.stderr.write(f"error: duplicate skill name in batch: {skill_dir.name}\n")
+            return 1
+        try:
+            output[skill_dir.name] = resolve(
+                project_root, skill_dir, args.key, custom_listing=custom_listing
+            )
+        except ConfigError as error:
+            sys.stderr.write(f"error: {error}\n")
+            return 1
     write_json_stdout(output)
     return 0
 
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Optional long-lived resolver for BMad central config and skill customization.
+
+`serve` binds a Unix-domain socket at `_bmad/.cache/resolver.sock` and answers
+one JSON request per line, keeping merged layers in memory and re-checking
+every layer's mtime, size, and inode before reuse:
+
+    {"op": "config", "keys": ["core.name"]}
+    {"op": "customization", "skill": "/abs/skill", "keys": []}
+    {"op": "shutdown"}
+
+Replies are `{"ok": true, "result": ...}` or `{"ok": false, "error": "..."}`.
+`resolve_config.py` and `resolve_customization.py` ask the daemon first and
+resolve in-process when no daemon is listening.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+# Installed scripts are consumer files, not a location for interpreter caches.
+sys.dont_write_bytecode = True
+
+from config_utils import (  # noqa: E402
+    ConfigError,
+    cache_dir_for,
+    central_layers,
+    customization_layers,
+    ensure_cache_dir,
+    fingerprint_layers,
+    fingerprint_settled,
+    load_central_config,
+    load_central_keys,
+    load_customization,
+    load_customization_keys,
+    select_keys,
+)
+
+# sockaddr_un paths are capped near 104 bytes on macOS and 108 on Linux.
+_MAX_SOCKET_PATH = 100
+
+
+def socket_path(project_root: Path) -> Path | None:
+    """The project's daemon socket, or None where Unix sockets cannot be used."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = cache_dir_for(project_root) / "resolver.sock"
+    return path if len(os.fsencode(path)) <= _MAX_SOCKET_PATH else None
+
+
+def query_daemon(project_root: Path, request: dict[str, Any], timeout: float = 5.0):
+    """Send one request to a running daemon; None when none answers."""
+    path = socket_path(project_root)
+    if path is None or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(os.fspath(path))
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as stream:
+                reply = json.loads(stream.readline())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(reply, dict) or "ok" not in reply:
+        return None
+    return reply
+
+
+class Resolver:
+    """In-memory merged results, reused while every layer's fingerprint holds."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+        self._lock = threading.Lock()
+        self._merged: dict[tuple[str, str], tuple[Any, int, Any]] = {}
+
+    def _resolve(self, kind: str, skill: str, layers, load) -> Any:
+        fingerprint = fingerprint_layers(layers)
+        with self._lock:
+            cached = self._merged.get((kind, skill))
+        if cached is not None and cached[0] == fingerprint:
+            if fingerprint_settled(fingerprint, cached[1]):
+                return cached[2]
+        merged = load()
+        with self._lock:
+            self._merged[(kind, skill)] = (fingerprint, time.time_ns(), merged)
+        return merged
+
+    def answer(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+        keys = request.get("keys") or []
+        if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+            return {"ok": False, "error": "keys must be a list of strings"}
+        op = request.get("op")
+        if op == "config":
+            name = ""
+            layers = central_layers(self.project_root)
+            load = partial(load_central_config, self.project_root)
+            load_keys = partial(load_central_keys, self.project_root, keys)
+        elif op == "customization":
+            name = request.get("skill")
+            if not isinstance(name, str) or not os.path.isabs(name):
+                return {"ok": False, "error": "skill must be an absolute path"}
+            skill_dir = Path(name)
+            layers = customization_layers(self.project_root, skill_dir)
+            load = partial(load_customization, self.project_root, skill_dir)
+            load_keys = partial(load_customization_keys, self.project_root, skill_dir, keys)
+        else:
+            return {"ok": False, "error": f"unknown op: {op!r}"}
+        try:
+            merged = self._resolve(op, name, layers, load)
+        except ConfigError as error:
+            if not keys:
+                return {"ok": False, "error": str(error)}
+            # In-process keyed lookups merge only the requested paths, so an identifier
+            # error in an unrelated table must not fail them here either.
+            try:
+                return {"ok": True, "result": load_keys()}
+            except ConfigError as error:
+                return {"ok": False, "error": str(error)}
+        return {"ok": True, "result": select_keys(merged, keys)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server: _Server = self.server  # type: ignore[assignment]
+        for line in self.rfile:
+            server.touch()
+            try:
+                request = json.loads(line)
+            except ValueError:
+                reply: dict[str, Any] = {"ok": False, "error": "request is not JSON"}
+            else:
+                if isinstance(request, dict) and request.get("op") == "shutdown":
+                    self.wfile.write(b'{"ok": true, "result": null}\n')
+                    server.stop()
+                    return
+                reply = server.resolver.answer(request)
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, resolver: Resolver, idle_timeout: float) -> None:
+        super().__init__(os.fspath(path), _Handler)
+        self.resolver = resolver
+        self.idle_timeout = idle_timeout
+        self._last_activity = time.monotonic()
+        self._stopping = False
+
+    def touch(self) -> None:
+        self._last_activity = time.monotonic()
+
+    def stop(self) -> None:
+        if not self._stopping:
+            self._stopping = True
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def service_actions(self) -> None:
+        if self.idle_timeout and time.monotonic() - self._last_activity > self.idle_timeout:
+            self.stop()
+
+
+def serve(project_root: Path, idle_timeout: float) -> int:
+    path = socket_path(project_root)
+    if path is None:
+        sys.stderr.write("error: Unix-domain sockets are unavailable for this project path\n")
+        return 2
+    if not (project_root / "_bmad").is_dir():
+        sys.stderr.write(f"error: project root does not contain _bmad/: {project_root}\n")
+        return 2
+    if query_daemon(project_root, {"op": "config", "keys": ["__ping__"]}) is not None:
+        sys.stderr.write(f"error: a resolver daemon is already listening on {path}\n")
+        return 2
+    ensure_cache_dir(path.parent)
+    path.unlink(missing_ok=True)  # a stale socket from a daemon that died
+    server = _Server(path, Resolver(project_root), idle_timeout)
+    try:
+        os.chmod(path, 0o600)
+        sys.stdout.write(f"listening on {path}\n")
+        sys.stdout.flush()
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve BMad config and customization resolution over a Unix socket."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_parser = sub.add_parser("serve", help="run the daemon in the foreground")
+    serve_parser.add_argument("--project-root", "-p", required=True)
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=900.0,
+        help="Exit after this many idle seconds (0 disables).",
+    )
+    stop_parser = sub.add_parser("stop", help="ask a running daemon to exit")
+    stop_parser.add_argument("--project-root", "-p", required=True)
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    if args.command == "serve":
+        return serve(project_root, args.idle_timeout)
+    if query_daemon(project_root, {"op": "shutdown"}) is None:
+        sys.stderr.write("error: no resolver daemon is listening\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,502 @@
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Micro-benchmarks for the shared config and render scripts.
+
+Run: uv run --python 3.11 src/scripts/tests/benchmarks.py <scenario>
+
+Each scenario builds a synthetic project in a temp directory, times the code
+paths it names, and prints one JSON object. Numbers are wall-clock medians so
+they stay comparable across runs on the same machine; they are not asserted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import config_utils  # noqa: E402
+
+
+def _median_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def synthetic_project(root: Path, skills: int = 50, agents: int = 40) -> list[Path]:
+    """Write four central layers plus `skills` skills with team and user overrides."""
+    bmad = root / "_bmad"
+    custom = bmad / "custom"
+    custom.mkdir(parents=True)
+    agent_tables = "".join(
+        f'[[agents]]\ncode = "agent-{index}"\nname = "Agent {index}"\n'
+        f'description = "{"synthetic prose " * 8}"\n\n'
+        for index in range(agents)
+    )
+    (bmad / "config.toml").write_text(
+        '[core]\ncommunication_language = "English"\n\n'
+        '[modules.bmm]\nplanning_artifacts = "{project-root}/planning"\n\n' + agent_tables,
+        encoding="utf-8",
+    )
+    (bmad / "config.user.toml").write_text('[core]\nuser_name = "Bench"\n', encoding="utf-8")
+    (custom / "config.toml").write_text(
+        '[[agents]]\ncode = "agent-1"\nname = "Team Agent"\n', encoding="utf-8"
+    )
+    (custom / "config.user.toml").write_text(
+        '[core]\ncommunication_language = "French"\n', encoding="utf-8"
+    )
+    skill_dirs = []
+    for index in range(skills):
+        skill = bmad / "bmm" / f"bench-skill-{index}"
+        skill.mkdir(parents=True)
+        (skill / "customize.toml").write_text(
+            "[workflow]\n"
+            + "".join(f'step_{step} = "{"default prose " * 6}"\n' for step in range(30))
+            + "".join(
+                f'[[workflow.review_layers]]\nid = "layer-{layer}"\ninstruction = "review"\n'
+                for layer in range(6)
+            ),
+            encoding="utf-8",
+        )
+        (custom / f"{skill.name}.toml").write_text(
+            '[workflow]\nstep_1 = "team"\n', encoding="utf-8"
+        )
+        (custom / f"{skill.name}.user.toml").write_text(
+            '[workflow]\nstep_2 = "user"\n', encoding="utf-8"
+        )
+        skill_dirs.append(skill)
+    return skill_dirs
+
+
+def bench_layer_cache(args: argparse.Namespace) -> dict[str, object]:
+    """Cold (no _bmad/.cache) vs warm resolution of central config plus every skill."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        skills = synthetic_project(root, skills=args.skills)
+
+        def resolve_all() -> None:
+            config_utils.load_central_config(root)
+            for skill in skills:
+                config_utils.load_customization(root, skill)
+
+        def cold() -> None:
+            for path in (root / "_bmad" / ".cache").glob("**/*.json"):
+                path.unlink()
+            resolve_all()
+
+        # Age the sources past the racy window so warm hits are stat-only.
+        old = time.time() - 60
+        for path in (root / "_bmad").rglob("*.toml"):
+            os.utime(path, (old, old))
+        return {
+            "scenario": "layer-cache",
+            "skills": args.skills,
+            "cold_ms": _median_ms(cold, args.repeat),
+            "warm_ms": _median_ms(resolve_all, args.repeat),
+        }
+
+
+def bench_slow_io(args: argparse.Namespace) -> dict[str, object]:
+    """Uncached central and skill loads with `--latency-ms` added to every open.
+
+    Sleeping releases the GIL like a blocking network-filesystem call, so this
+    shows what concurrent layer reads save over reading layers one by one.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        skill = synthetic_project(root, skills=1)[0]
+        layers = config_utils.central_layers(root) + config_utils.customization_layers(root, skill)
+        real_open = os.open
+
+        def slow_open(*open_args, **open_kwargs):
+            time.sleep(args.latency_ms / 1000)
+            return real_open(*open_args, **open_kwargs)
+
+        os.open = slow_open
+        try:
+            serial_ms = _median_ms(
+                lambda: [config_utils.load_toml(path, required=required) for path, required in layers],
+                args.repeat,
+            )
+            concurrent_ms = _median_ms(lambda: config_utils.load_layers(layers), args.repeat)
+        finally:
+            os.open = real_open
+    return {
+        "scenario": "slow-io",
+        "layers": len(layers),
+        "latency_ms": args.latency_ms,
+        "serial_ms": serial_ms,
+        "concurrent_ms": concurrent_ms,
+    }
+
+
+def synthetic_skill(root: Path, files: int = 200) -> Path:
+    """An installed project with one skill of `files` token-bearing Markdown sources."""
+    bmad = root / "_bmad"
+    skill = bmad / "bmm" / "bench-render"
+    (skill / "steps").mkdir(parents=True)
+    (bmad / "config.toml").write_text(
+        '[core]\ncommunication_language = "English"\n\n'
+        '[modules.bmm]\nplanning_artifacts = "{project-root}/planning"\n',
+        encoding="utf-8",
+    )
+    (skill / "customize.toml").write_text(
+        '[workflow]\npersistent_facts = ["fact"]\n', encoding="utf-8"
+    )
+    (skill / "workflow.md").write_text(
+        "".join(f"- [[bmad-snapshot:steps/step-{index}.md]]\n" for index in range(files - 1)),
+        encoding="utf-8",
+    )
+    paragraph = (
+        "Speak {{.communication_language}} and save to {{config.modules.bmm.planning_artifacts}}.\n"
+        + "Plain prose without tokens. " * 30
+        + "\n{workflow.persistent_facts}\n"
+    )
+    for index in range(files - 1):
+        (skill / "steps" / f"step-{index}.md").write_text(paragraph * 20, encoding="utf-8")
+    return skill
+
+
+def bench_render(args: argparse.Namespace) -> dict[str, object]:
+    """Publishing a fresh generation of a `--files`-source skill, eager and lazy, and the token phases alone."""
+    import render_skill
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        skill = synthetic_skill(root, args.files)
+        sources = render_skill._load_sources(skill)
+        central = config_utils.load_central_config(root)
+        customization = config_utils.load_customization(root, skill)
+        defaults = config_utils.load_toml(skill / "customize.toml", required=True)
+
+        def tokens() -> None:
+            scanned = render_skill._scan_tokens(sources)
+            replacements, _ = render_skill._resolve_replacements(
+                scanned, central, customization, defaults, root
+            )
+            render_skill._render_sources(sources, scanned, replacements, root / "out")
+
+        def publish() -> None:
+            shutil.rmtree(root / "_bmad" / "render", ignore_errors=True)
+            render_skill.render(root, skill)
+
+        def publish_lazy() -> None:
+            shutil.rmtree(root / "_bmad" / "render", ignore_errors=True)
+            render_skill.render(root, skill, lazy=True)
+
+        return {
+            "scenario": "render",
+            "files": args.files,
+            "tokens_ms": _median_ms(tokens, args.repeat),
+            "render_ms": _median_ms(publish, args.repeat),
+            "lazy_render_ms": _median_ms(publish_lazy, args.repeat),
+        }
+
+
+def bench_render_batch(args: argparse.Namespace) -> dict[str, object]:
+    """`--skills` rendered skills: one process per skill vs one `--all` process."""
+    script = Path(__file__).resolve().parents[1] / "render_skill.py"
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        template = synthetic_skill(root, args.files)
+        (template / "SKILL.md").write_text("Run render_skill.py.\n", encoding="utf-8")
+        skills = [template]
+        for index in range(1, args.skills):
+            skills.append(template.with_name(f"bench-render-{index}"))
+            shutil.copytree(template, skills[-1])
+
+        def spawned() -> None:
+            shutil.rmtree(root / "_bmad" / "render", ignore_errors=True)
+            for skill in skills:
+                subprocess.run(
+                    [sys.executable, str(script), "--project-root", str(root), "--skill", str(skill)],
+                    stdout=subprocess.DEVNULL,
+                    check=True,
+                )
+
+        def batch() -> None:
+            shutil.rmtree(root / "_bmad" / "render", ignore_errors=True)
+            subprocess.run(
+                [sys.executable, str(script), "--project-root", str(root), "--all"],
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+
+        return {
+            "scenario": "render-batch",
+            "skills": args.skills,
+            "files_per_skill": args.files,
+            "spawn_per_skill_ms": _median_ms(spawned, args.repeat),
+            "all_ms": _median_ms(batch, args.repeat),
+        }
+
+
+def bench_render_rss(args: argparse.Namespace) -> dict[str, object]:
+    """Peak RSS of one render process for a skill with `--reference-mb` MB reference docs."""
+    import resource
+
+    script = Path(__file__).resolve().parents[1] / "render_skill.py"
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        skill = synthetic_skill(root, args.files)
+        references = skill / "references"
+        references.mkdir()
+        line = "Reference prose without any render tokens in it at all.\n"
+        block = line * (1024 * 1024 // len(line))
+        for index in range(4):
+            with (references / f"reference-{index}.md").open("w", encoding="utf-8") as stream:
+                for _ in range(args.reference_mb // 4):
+                    stream.write(block)
+        # One large source that does carry a token.
+        (references / "glossary.md").write_text(
+            "Language: {{.communication_language}}\n" + block * 4, encoding="utf-8"
+        )
+        peaks = []
+        for _ in range(args.repeat):
+            shutil.rmtree(root / "_bmad" / "render", ignore_errors=True)
+            # RUSAGE_CHILDREN reports the largest child so far, so measure each
+            # render in a fresh intermediate process.
+            probe = (
+                "import resource, subprocess, sys;"
+                "subprocess.run(sys.argv[1:], stdout=subprocess.DEVNULL, check=True);"
+                "print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)"
+            )
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    probe,
+                    sys.executable,
+                    str(script),
+                    "--project-root",
+                    str(root),
+                    "--skill",
+                    str(skill),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            peaks.append(int(result.stdout))
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return {
+            "scenario": "render-rss",
+            "files": args.files,
+            "reference_mb": args.reference_mb + 4,
+            "peak_rss_mb": round(statistics.median(peaks) / scale, 1),
+        }
+
+
+def bench_memlog(args: argparse.Namespace) -> dict[str, object]:
+    """One `memlog.py append`, and a tail-20 `query`, on a log holding `--count` entries."""
+    import contextlib
+    import io
+
+    import memlog
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / ".memlog.md"
+        with contextlib.redirect_stdout(io.StringIO()):
+            memlog.main(["init", "--path", str(path), "--field", "topic=bench"])
+        path.write_text(
+            path.read_text(encoding="utf-8").rstrip("\n")
+            + "\n"
+            + "".join(f"- (idea by user) idea number {index}\n" for index in range(args.count)),
+            encoding="utf-8",
+        )
+
+        def append() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                memlog.main(["append", "--path", str(path), "--text", "one more", "--type", "idea"])
+
+        def tail() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                memlog.main(["query", "--path", str(path), "--tail", "20"])
+
+        return {
+            "scenario": "memlog",
+            "entries": args.count,
+            "append_ms": _median_ms(append, args.repeat),
+            "query_tail_ms": _median_ms(tail, args.repeat),
+        }
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3),
+    }
+
+
+def bench_daemon(args: argparse.Namespace) -> dict[str, object]:
+    """Sequential `--key` lookups: daemon round-trips vs spawning resolve_config.py."""
+    import resolver_daemon
+
+    scripts = Path(__file__).resolve().parents[1]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        synthetic_project(root, skills=1)
+        daemon = subprocess.Popen(
+            [sys.executable, str(scripts / "resolver_daemon.py"), "serve", "-p", str(root)],
+            stdout=subprocess.PIPE,
+        )
+        try:
+            daemon.stdout.readline()
+            request = {"op": "config", "keys": ["core.communication_language"]}
+            socket_samples = []
+            for _ in range(args.count):
+                start = time.perf_counter()
+                resolver_daemon.query_daemon(root, request)
+                socket_samples.append(time.perf_counter() - start)
+            command = [
+                sys.executable,
+                str(scripts / "resolve_config.py"),
+                "-p",
+                str(root),
+                "-k",
+                "core.communication_language",
+            ]
+            client_samples = []
+            for _ in range(args.count):
+                start = time.perf_counter()
+                subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+                client_samples.append(time.perf_counter() - start)
+            resolver_daemon.query_daemon(root, {"op": "shutdown"})
+            daemon.wait(timeout=10)
+        finally:
+            if daemon.poll() is None:
+                daemon.kill()
+            daemon.stdout.close()
+        spawn_samples = []
+        for _ in range(args.count):
+            start = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+            spawn_samples.append(time.perf_counter() - start)
+    return {
+        "scenario": "daemon",
+        "lookups": args.count,
+        "daemon_socket": _percentiles(socket_samples),
+        "spawned_client_with_daemon": _percentiles(client_samples),
+        "spawned_in_process": _percentiles(spawn_samples),
+    }
+
+
+def synthetic_layers(keys: int = 10_000) -> list[dict[str, object]]:
+    """A `keys`-leaf central config plus three sparse override layers."""
+    modules = {
+        f"module_{module}": {f"key_{key}": f"value {module}.{key}" for key in range(keys // 20)}
+        for module in range(10)
+    }
+    agents = [
+        {"code": f"agent-{index}", "name": f"Agent {index}", "menu": [f"item {index}"]}
+        for index in range(keys // 2 // 3)
+    ]
+    base = {"core": {"name": "base"}, "modules": modules, "agents": agents}
+    return [
+        base,
+        {"core": {"name": "user"}},
+        {"modules": {"module_3": {"key_7": "team"}}, "agents": [{"code": "agent-5", "name": "Team"}]},
+        {"agents": [{"code": "agent-new", "name": "New"}]},
+    ]
+
+
+def bench_merge(args: argparse.Namespace) -> dict[str, object]:
+    """Time and allocation of a four-layer merge over a synthetic 10k-leaf config."""
+    layers = synthetic_layers(args.keys)
+    tracemalloc.start()
+    merged = config_utils.merge_layers(layers)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del merged
+    return {
+        "scenario": "merge",
+        "keys": args.keys,
+        "merge_ms": _median_ms(lambda: config_utils.merge_layers(layers), args.repeat),
+        "retained_kib": round(retained / 1024, 1),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def bench_select(args: argparse.Namespace) -> dict[str, object]:
+    """One `--key` lookup over the synthetic config: full merge then extract vs path merge."""
+    layers = synthetic_layers(args.keys)
+    keys = ["core.name"]
+    return {
+        "scenario": "select",
+        "keys": args.keys,
+        "full_merge_ms": _median_ms(
+            lambda: config_utils.select_keys(config_utils.merge_layers(layers), keys), args.repeat
+        ),
+        "merge_selected_ms": _median_ms(
+            lambda: config_utils.merge_selected(layers, keys), args.repeat
+        ),
+    }
+
+
+def bench_keyed_arrays(args: argparse.Namespace) -> dict[str, object]:
+    """Four layers of `--keys` agent tables each: merge_layers vs a pairwise fold."""
+    layers = [
+        {"agents": [{"code": f"agent-{index + layer * args.keys // 2}"} for index in range(args.keys)]}
+        for layer in range(4)
+    ]
+    return {
+        "scenario": "keyed-arrays",
+        "items_per_layer": args.keys,
+        "merge_layers_ms": _median_ms(lambda: config_utils.merge_layers(layers), args.repeat),
+        "pairwise_fold_ms": _median_ms(
+            lambda: functools.reduce(config_utils.structural_merge, layers, {}), args.repeat
+        ),
+    }
+
+
+SCENARIOS: dict[str, Callable[[argparse.Namespace], dict[str, object]]] = {
+    "daemon": bench_daemon,
+    "keyed-arrays": bench_keyed_arrays,
+    "layer-cache": bench_layer_cache,
+    "memlog": bench_memlog,
+    "merge": bench_merge,
+    "render": bench_render,
+    "render-batch": bench_render_batch,
+    "render-rss": bench_render_rss,
+    "select": bench_select,
+    "slow-io": bench_slow_io,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--skills", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--reference-mb", type=int, default=64)
+    args = parser.parse_args()
+    print(json.dumps(SCENARIOS[args.scenario](args)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parents[1]
+SCRIPT = SCRIPTS / "compile_config.py"
+
+
+class CompileConfigTests(unittest.TestCase):
+    def test_compiles_bundle_and_rejects_broken_layers(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            custom = root / "_bmad" / "custom"
+            skill = root / "_bmad" / "bmm" / "alpha"
+            skill.mkdir(parents=True)
+            custom.mkdir()
+            (root / "_bmad" / "config.toml").write_text('[core]\nname = "base"\n', encoding="utf-8")
+            (skill / "customize.toml").write_text('[workflow]\nname = "a"\n', encoding="utf-8")
+
+            result = self._run("--project-root", str(root), "--skills-root", str(root / "_bmad"))
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            bundle = json.loads((root / "_bmad" / "config.bundle").read_text(encoding="utf-8"))
+            self.assertEqual(bundle["central"]["data"], {"core": {"name": "base"}})
+            self.assertEqual(
+                bundle["skills"][str(skill.resolve())]["data"], {"workflow": {"name": "a"}}
+            )
+
+            (custom / "alpha.toml").write_text("[broken\n", encoding="utf-8")
+            failed = self._run("--project-root", str(root), "--skill", str(skill))
+            self.assertEqual(failed.returncode, 1)
+            self.assertIn("failed to parse", failed.stderr)
+            self.assertEqual(
+                json.loads((root / "_bmad" / "config.bundle").read_text(encoding="utf-8")),
+                bundle,
+            )
+
+    @staticmethod
+    def _run(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), *args],
+            text=True,
+            encoding="utf-8",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
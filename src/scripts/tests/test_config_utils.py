@@ -1,20 +1,60 @@
+import functools
+import json
+import os
+import random
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+import config_utils  # noqa: E402
 from config_utils import (  # noqa: E402
     ConfigError,
+    compile_bundle,
     load_central_config,
+    load_central_keys,
     load_customization,
+    load_layers,
     load_toml,
+    merge_layers,
+    merge_selected,
+    select_keys,
     structural_merge,
+    write_bundle,
 )
 
 
+def random_value(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth < 3 and roll < 0.35:
+        return {rng.choice("abcd"): random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))}
+    if depth < 3 and roll < 0.7:
+        items = []
+        for _ in range(rng.randint(0, 4)):
+            if rng.random() < 0.1:
+                items.append(rng.choice(["plain", 3]))
+                continue
+            item = {"value": rng.randint(0, 9)}
+            for field in ("code", "id"):
+                if rng.random() < 0.8:
+                    item[field] = rng.choice(["x", "y", "z", "x", "", 7])
+            items.append(item)
+        return items
+    return rng.choice(["s", 1, True, 2.5])
+
+
+def merge_outcome(merge, layers):
+    try:
+        return json.dumps(merge(layers))
+    except ConfigError as error:
+        return f"error: {error}"
+
+
 class ConfigUtilsTests(unittest.TestCase):
     def test_structural_merge_recurses_appends_and_replaces_keyed_tables(self):
         base = {
@@ -43,6 +83,84 @@ class ConfigUtilsTests(unittest.TestCase):
             ],
         )
 
+    def test_merge_shares_untouched_subtrees_and_leaves_inputs_intact(self):
+        untouched = {"deep": {"leaf": 1}}
+        kept_item = {"code": "keep", "value": "base"}
+        base = {"big": untouched, "nested": {"a": 1}, "items": [kept_item, {"code": "swap"}]}
+        override = {"nested": {"b": 2}, "items": [{"code": "swap", "value": "new"}]}
+
+        merged = merge_layers([base, {}, override])
+
+        self.assertIs(merged["big"], untouched)
+        self.assertIs(merged["items"][0], kept_item)
+        self.assertIs(merged["items"][1], override["items"][0])
+        self.assertEqual(merged["nested"], {"a": 1, "b": 2})
+        self.assertEqual(base["nested"], {"a": 1})
+        self.assertEqual(base["items"][1], {"code": "swap"})
+
+    def test_merge_layers_matches_pairwise_fold(self):
+        rng = random.Random(1729)
+        for _ in range(3000):
+            layers = [
+                {rng.choice("abcd"): random_value(rng, 1) for _ in range(rng.randint(0, 3))}
+                for _ in range(rng.randint(1, 4))
+            ]
+            with self.subTest(layers=layers):
+                self.assertEqual(
+                    merge_outcome(merge_layers, layers),
+                    merge_outcome(lambda ls: functools.reduce(structural_merge, ls, {}), layers),
+                )
+
+    def test_selected_keys_match_full_merge(self):
+        rng = random.Random(20260418)
+        paths = ["a", "b", "a.b", "a.c", "b.a.d", "c.d.a", "missing", "a.missing.b"]
+        for _ in range(2000):
+            layers = [
+                {rng.choice("abcd"): random_value(rng, 1) for _ in range(rng.randint(0, 3))}
+                for _ in range(rng.randint(1, 4))
+            ]
+            keys = rng.sample(paths, rng.randint(1, 3))
+            full = merge_outcome(merge_layers, layers)
+            if full.startswith("error: "):
+                continue
+            with self.subTest(layers=layers, keys=keys):
+                self.assertEqual(
+                    merge_outcome(lambda ls: merge_selected(ls, keys), layers),
+                    json.dumps(select_keys(json.loads(full), keys)),
+                )
+
+    def test_selected_keys_skip_errors_in_unrelated_tables(self):
+        layers = [{"ok": {"name": "base"}, "bad": [{"id": "x"}]}, {"bad": [{"id": 7}]}]
+
+        self.assertEqual(merge_selected(layers, ["ok.name"]), {"ok.name": "base"})
+        with self.assertRaisesRegex(ConfigError, "must be a string"):
+            merge_selected(layers, ["bad"])
+
+    def test_provenance_names_the_layer_behind_each_leaf_and_item(self):
+        layers = [
+            {"core": {"name": "base", "keep": 1}, "agents": [{"code": "a"}, {"code": "b"}]},
+            {},
+            {"core": {"name": "user"}, "agents": [{"code": "a", "name": "A"}], "plain": [1]},
+            {"plain": [1, 2]},
+        ]
+        provenance = {}
+
+        merged = merge_layers(layers, provenance)
+
+        self.assertEqual(merged, merge_layers(layers))
+        self.assertEqual(
+            provenance,
+            {
+                "core.name": 2,
+                "core.keep": 0,
+                "agents[0]": 2,
+                "agents[1]": 0,
+                "plain[0]": 2,
+                "plain[1]": 3,
+                "plain[2]": 3,
+            },
+        )
+
     def test_non_string_keyed_identifier_is_rejected(self):
         with self.assertRaisesRegex(ConfigError, "identifier `id` must be a string"):
             structural_merge([{"id": "valid"}], [{"id": 42}])
@@ -61,6 +179,45 @@ class ConfigUtilsTests(unittest.TestCase):
 
             self.assertEqual(load_toml(path), {})
 
+    def test_concurrent_layer_loading_raises_the_first_error_in_layer_order(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "ok.toml").write_text("a = 1\n", encoding="utf-8")
+            (root / "broken.toml").write_text("[broken\n", encoding="utf-8")
+            (root / "dir.toml").mkdir()
+            missing = root / "missing.toml"
+
+            self.assertEqual(
+                load_layers([(root / "ok.toml", True), (missing, False)]), [{"a": 1}, {}]
+            )
+            with self.assertRaisesRegex(ConfigError, "not a file"):
+                load_layers([(root / "ok.toml", True), (root / "dir.toml", False), (missing, True)])
+            with self.assertRaisesRegex(ConfigError, "required TOML file not found"):
+                load_layers([(missing, True), (root / "broken.toml", False)])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_layer_loading_works_in_a_forked_child(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            layers = [(root / f"{index}.toml", False) for index in range(6)]
+            (root / "0.toml").write_text("a = 1\n", encoding="utf-8")
+            load_layers(layers)  # fills the loader pool in this process
+            load_layers(layers)
+
+            pid = os.fork()
+            if not pid:
+                os._exit(0 if load_layers(layers)[0] == {"a": 1} else 1)
+            for _ in range(100):
+                finished, status = os.waitpid(pid, os.WNOHANG)
+                if finished:
+                    break
+                time.sleep(0.1)
+            else:
+                os.kill(pid, 9)
+                os.waitpid(pid, 0)
+                self.fail("load_layers hung in the forked child")
+            self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
     def test_filesystem_layer_precedence(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
@@ -80,6 +237,108 @@ class ConfigUtilsTests(unittest.TestCase):
             self.assertEqual(load_central_config(root)["value"]["order"], "custom-user")
             self.assertEqual(load_customization(root, skill)["value"]["order"], "user")
 
+    def test_warm_layer_cache_skips_parsing_and_tracks_edits(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            bmad.mkdir()
+            (bmad / "config.toml").write_text('[core]\nname = "cold"\n', encoding="utf-8")
+            cold = load_central_config(root)
+            self.assertTrue((bmad / ".cache" / ".gitignore").is_file())
+
+            with mock.patch.object(config_utils.tomllib, "loads", side_effect=AssertionError):
+                self.assertEqual(load_central_config(root), cold)
+
+            # Same size, same coarse timestamp window: the content hash catches it.
+            (bmad / "config.toml").write_text('[core]\nname = "warm"\n', encoding="utf-8")
+            self.assertEqual(load_central_config(root)["core"]["name"], "warm")
+
+    def test_cache_files_are_json_and_round_trip_toml_values(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            bmad.mkdir()
+            (bmad / "config.toml").write_text(
+                '[core]\nat = 1979-05-27T07:32:00-08:00\nday = 1979-05-27\nclock = 07:32:00.5\n'
+                'inf = inf\n"$datetime" = "a string"\n[core.tagged]\n"$date" = "not a date"\n',
+                encoding="utf-8",
+            )
+            cold = load_central_config(root)
+            with mock.patch.object(config_utils.tomllib, "loads", side_effect=AssertionError):
+                self.assertEqual(load_central_config(root), cold)
+                self.assertEqual(load_central_keys(root, ["core.tagged"]), {"core.tagged": {"$date": "not a date"}})
+            for path in (bmad / ".cache").glob("*/*"):
+                self.assertEqual(json.loads(path.read_bytes())["version"], config_utils._CACHE_VERSION)
+
+    def test_merged_snapshot_serves_unchanged_layers_and_tracks_absent_ones(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            bmad.mkdir()
+            base = bmad / "config.toml"
+            base.write_text('[core]\nname = "base"\n', encoding="utf-8")
+            os.utime(base, (1, 1))  # outside the racy window
+            with mock.patch.object(config_utils, "merge_layers", side_effect=AssertionError):
+                self.assertEqual(load_central_keys(root, ["core.name"]), {"core.name": "base"})
+            first = load_central_config(root)
+
+            with mock.patch.object(config_utils, "merge_layers", side_effect=AssertionError):
+                self.assertEqual(load_central_config(root), first)
+
+            (bmad / "config.user.toml").write_text('[core]\nname = "user"\n', encoding="utf-8")
+            self.assertEqual(load_central_config(root)["core"]["name"], "user")
+
+    def test_customization_cache_requires_installed_bmad(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            skill = root / "skill"
+            skill.mkdir()
+            (skill / "customize.toml").write_text("[agent]\nname = \"A\"\n", encoding="utf-8")
+
+            self.assertEqual(load_customization(root, skill), {"agent": {"name": "A"}})
+            self.assertFalse((root / "_bmad").exists())
+
+    def test_compiled_bundle_serves_current_entries_and_skips_edited_ones(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            skill = bmad / "bmm" / "alpha"
+            skill.mkdir(parents=True)
+            (bmad / "config.toml").write_text('[core]\nname = "base"\n', encoding="utf-8")
+            (skill / "customize.toml").write_text('[workflow]\nname = "a"\n', encoding="utf-8")
+            for path in (bmad / "config.toml", skill / "customize.toml"):
+                os.utime(path, (1, 1))  # outside the racy window
+            write_bundle(root, compile_bundle(root, [skill]))
+
+            with mock.patch.object(config_utils, "load_toml", side_effect=AssertionError):
+                self.assertEqual(load_central_config(root), {"core": {"name": "base"}})
+                self.assertEqual(load_customization(root, skill), {"workflow": {"name": "a"}})
+
+    def test_compiled_bundle_round_trips_toml_dates(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            skill = bmad / "bmm" / "alpha"
+            skill.mkdir(parents=True)
+            (bmad / "config.toml").write_text('[core]\nname = "base"\n', encoding="utf-8")
+            (skill / "customize.toml").write_text(
+                '[workflow]\nwhen = 2024-01-01\nat = 2024-01-01T09:30:00Z\n', encoding="utf-8"
+            )
+            for path in (bmad / "config.toml", skill / "customize.toml"):
+                os.utime(path, (1, 1))  # outside the racy window
+            write_bundle(root, compile_bundle(root, [skill]))
+
+            with mock.patch.object(config_utils, "load_toml", side_effect=AssertionError):
+                self.assertEqual(
+                    load_customization(root, skill)["workflow"],
+                    load_toml(skill / "customize.toml")["workflow"],
+                )
+
+            (skill / "customize.toml").write_text('[workflow]\nname = "b"\n', encoding="utf-8")
+            self.assertEqual(load_customization(root, skill), {"workflow": {"name": "b"}})
+            (bmad / "config.user.toml").write_text('[core]\nname = "user"\n', encoding="utf-8")
+            self.assertEqual(load_central_config(root), {"core": {"name": "user"}})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ The spine under test is the flat, append-only, chronological invariant: every en
 one line recorded at the end in the order it happened — no sections, no grouping, and no
 lifecycle status the log would have to mutate.
 """
+import io
 import json
 import sys
 from pathlib import Path
@@ -287,6 +288,243 @@ def test_newline_in_field_is_neutralized(ws):
     assert "\n" not in meta["topic"]
 
 
+def test_later_appends_do_not_rewrite_the_file(ws, monkeypatch):
+    init(ws)
+    append(ws, "first", entry_type="idea")  # the first entry is a full rewrite
+
+    def no_rewrite(*_):
+        raise AssertionError("append rewrote the whole memlog")
+
+    monkeypatch.setattr(memlog, "write_atomic", no_rewrite)
+    append(ws, "second", entry_type="idea")
+    append(ws, "third")
+    assert entries(ws) == ["- (idea) first", "- (idea) second", "- third"]
+    meta, body = memlog.split(read(ws))
+    assert memlog.render(meta, body) == read(ws)  # byte-identical to a full rewrite
+    assert not (Path(ws) / (MEMLOG + ".wal")).exists()
+
+
+def test_crashed_append_is_cut_back_on_next_write(ws):
+    init(ws)
+    append(ws, "kept")
+    path = Path(ws) / MEMLOG
+    size = path.stat().st_size
+    torn = b"- lost entry\n"
+    (Path(ws) / (MEMLOG + ".wal")).write_text(
+        f"{size} {size + len(torn)} {memlog.hashlib.sha256(torn).hexdigest()}\n"
+    )
+    with open(path, "ab") as f:
+        f.write(torn[:5])  # the crash landed only part of the line
+    append(ws, "next")
+    assert entries(ws) == ["- kept", "- next"]
+
+
+def test_fully_landed_append_survives_recovery(ws):
+    init(ws)
+    append(ws, "kept")
+    path = Path(ws) / MEMLOG
+    size = path.stat().st_size
+    landed = b"- landed before the crash\n"
+    (Path(ws) / (MEMLOG + ".wal")).write_text(
+        f"{size} {size + len(landed)} {memlog.hashlib.sha256(landed).hexdigest()}\n"
+    )
+    with open(path, "ab") as f:
+        f.write(landed)
+    append(ws, "next")
+    assert entries(ws) == ["- kept", "- landed before the crash", "- next"]
+
+
+def test_append_survives_a_concurrent_recovery(ws, monkeypatch):
+    init(ws)
+    append(ws, "first")
+    stamp = memlog.now
+
+    def recover_then_stamp():
+        memlog.recover(Path(ws) / MEMLOG)  # another process replays this append's WAL
+        return stamp()
+
+    monkeypatch.setattr(memlog, "now", recover_then_stamp)
+    append(ws, "second")
+    assert entries(ws) == ["- first", "- second"]
+
+
+def test_memlog_is_written_with_lf_line_ends(ws):
+    init(ws)
+    append(ws, "first")
+    data = (Path(ws) / MEMLOG).read_bytes()
+    assert b"\r" not in data and b"\n---\n" in data
+
+
+def test_entry_count_comes_from_the_sidecar(ws, capsys, monkeypatch):
+    init(ws)
+    append(ws, "a")
+    append(ws, "b")
+    monkeypatch.setattr(memlog, "reindex", None)  # a recount would raise
+    monkeypatch.setattr(memlog, "logical_entries", None)
+    append(ws, "c")
+    out = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert out["entries"] == 3
+
+
+def test_stale_or_missing_count_sidecar_heals_by_recount(ws, capsys):
+    init(ws)
+    append(ws, "a")
+    append(ws, "b")
+    path = Path(ws) / MEMLOG
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("- hand-added\n")  # edited outside memlog.py: the sidecar's stat no longer matches
+    append(ws, "c")
+    assert json.loads(capsys.readouterr().out.strip().splitlines()[-1])["entries"] == 4
+    (Path(ws) / (MEMLOG + ".count")).unlink()
+    append(ws, "d")
+    assert json.loads(capsys.readouterr().out.strip().splitlines()[-1])["entries"] == 5
+    assert memlog.cached_count(path) == 5
+
+
+def test_append_batch_writes_entries_in_order_once(ws, tmp_path, capsys, monkeypatch):
+    init(ws)
+    batch = tmp_path / "batch.jsonl"
+    batch.write_text(
+        '{"text": "first", "type": "idea"}\n'
+        "\n"
+        '{"text": "second\\nline", "type": "idea", "by": "user"}\n'
+        '{"text": "third", "by": "coach"}\n',
+        encoding="utf-8",
+    )
+    # The first entries of an empty body go through one full rewrite.
+    writes = []
+    real_write = memlog.write_atomic
+    monkeypatch.setattr(memlog, "write_atomic", lambda *a: writes.append(a) or real_write(*a))
+    assert memlog.main(["append-batch", "--workspace", ws, "--file", str(batch)]) == 0
+    assert len(writes) == 1
+    assert entries(ws) == ["- (idea) first", "- (idea by user) second line", "- (by coach) third"]
+    assert json.loads(capsys.readouterr().out.strip().splitlines()[-1])["entries"] == 3
+
+    monkeypatch.setattr(memlog.sys, "stdin", io.StringIO('{"text": "fourth"}\n{"text": "fifth"}\n'))
+    assert memlog.main(["append-batch", "--workspace", ws]) == 0
+    assert len(writes) == 1  # later batches append in place
+    assert entries(ws)[-2:] == ["- fourth", "- fifth"]
+    assert json.loads(capsys.readouterr().out.strip().splitlines()[-1])["entries"] == 5
+
+
+def test_append_batch_rejects_bad_lines_without_writing(ws, tmp_path):
+    init(ws)
+    before = read(ws)
+    batch = tmp_path / "batch.jsonl"
+    for bad in ('{"text": "ok"}\nnot json\n', '{"type": "idea"}\n', '{"text": "x", "by": 3}\n', ""):
+        batch.write_text(bad, encoding="utf-8")
+        assert memlog.main(["append-batch", "--workspace", ws, "--file", str(batch)]) == 2
+    assert read(ws) == before
+
+
+def query(ws, capsys, *args):
+    capsys.readouterr()
+    assert memlog.main(["query", "--workspace", ws, *args]) == 0
+    out = json.loads(capsys.readouterr().out)
+    return [(m["n"], m["type"], m["by"], m["text"]) for m in out["matches"]]
+
+
+def seed(ws):
+    init(ws)
+    append(ws, "sample data first", entry_type="idea", by="user")
+    append(ws, "started SCAMPER", entry_type="technique")
+    append(ws, "lead with one account", entry_type="decision", by="coach")
+    append(ws, "plain note")
+    append(ws, "defer multi-account", entry_type="decision")
+
+
+def test_query_filters_by_type_and_author(ws, capsys):
+    seed(ws)
+    assert query(ws, capsys, "--type", "decision") == [
+        (3, "decision", "coach", "lead with one account"),
+        (5, "decision", None, "defer multi-account"),
+    ]
+    assert query(ws, capsys, "--by", "user") == [(1, "idea", "user", "sample data first")]
+    assert query(ws, capsys, "--type", "decision", "--tail", "1") == [
+        (5, "decision", None, "defer multi-account")
+    ]
+
+
+def test_query_tail_and_range(ws, capsys):
+    seed(ws)
+    assert [row[0] for row in query(ws, capsys, "--tail", "2")] == [4, 5]
+    assert [row[0] for row in query(ws, capsys, "--tail", "9")] == [1, 2, 3, 4, 5]
+    assert [row[0] for row in query(ws, capsys, "--type", "decision", "--tail", "4")] == [3, 5]
+    assert [row[0] for row in query(ws, capsys, "--range", "2:3")] == [2, 3]
+    assert [row[0] for row in query(ws, capsys, "--range", "4:")] == [4, 5]
+    assert query(ws, capsys, "--range", "9:") == []
+    assert memlog.main(["query", "--workspace", ws, "--range", "0:2"]) == 2
+
+
+def test_query_reads_only_indexed_lines(ws, capsys, monkeypatch):
+    seed(ws)
+    monkeypatch.setattr(memlog, "split", None)  # no full parse of the memlog
+    monkeypatch.setattr(memlog, "reindex", None)
+    assert query(ws, capsys, "--tail", "1") == [(5, "decision", None, "defer multi-account")]
+
+
+def test_index_survives_set_and_heals_after_hand_edit(ws, capsys):
+    seed(ws)
+    memlog.main(["set", "--workspace", ws, "--key", "goal", "--value", "a much longer goal than before"])
+    assert query(ws, capsys, "--range", "1:1") == [(1, "idea", "user", "sample data first")]
+    path = Path(ws) / MEMLOG
+    path.write_text(read(ws).replace("- plain note\n", "- (risk) hand added\n"), encoding="utf-8")
+    assert query(ws, capsys, "--type", "risk") == [(4, "risk", None, "hand added")]
+
+
+def test_lost_or_truncated_labels_rebuild_the_index(ws, capsys):
+    seed(ws)
+    labels = Path(ws) / (MEMLOG + ".labels")
+    labels.unlink()
+    assert query(ws, capsys, "--range", "1:1") == [(1, "idea", "user", "sample data first")]
+    labels.unlink()
+    append(ws, "who asked?", entry_type="question", by="coach")
+    assert query(ws, capsys, "--type", "question") == [(6, "question", "coach", "who asked?")]
+    assert query(ws, capsys, "--by", "user") == [(1, "idea", "user", "sample data first")]
+    labels.write_text('["idea"]', encoding="utf-8")
+    assert query(ws, capsys, "--tail", "1") == [(6, "question", "coach", "who asked?")]
+
+
+def test_segments_seal_and_read_as_one_log(ws, capsys):
+    init(ws, topic="long session", segment_bytes="60")
+    for n in range(1, 11):
+        append(ws, f"entry number {n}", entry_type="idea" if n % 2 else None)
+    segments = sorted(Path(ws).glob(MEMLOG + ".0*"))
+    assert len(segments) >= 2
+    counts = [int(c) for c in memlog.split(read(ws))[0]["segments"].split(",")]
+    assert len(counts) == len(segments)
+    sealed = [ln for seg in segments for ln in seg.read_text(encoding="utf-8").splitlines()]
+    assert sealed + entries(ws) == [
+        f"- (idea) entry number {n}" if n % 2 else f"- entry number {n}" for n in range(1, 11)
+    ]
+    out = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert out["entries"] == 10
+    assert [row[3] for row in query(ws, capsys)] == [f"entry number {n}" for n in range(1, 11)]
+    assert [row[0] for row in query(ws, capsys, "--type", "idea")] == [1, 3, 5, 7, 9]
+    assert query(ws, capsys, "--range", "2:2") == [(2, None, None, "entry number 2")]
+
+
+def test_sealed_segments_are_never_rewritten(ws, capsys):
+    init(ws, segment_bytes="40")
+    append(ws, "first entry that fills a segment")
+    append(ws, "second entry that fills a segment")
+    first = Path(ws) / (MEMLOG + ".0001")
+    before = (first.read_bytes(), first.stat().st_mtime_ns)
+    for n in range(5):
+        append(ws, f"later {n}")
+    assert (first.read_bytes(), first.stat().st_mtime_ns) == before
+    for suffix in (".idx", ".count"):  # both sidecars heal across every segment
+        (Path(ws) / (MEMLOG + suffix)).unlink()
+    assert [row[0] for row in query(ws, capsys, "--tail", "2")] == [6, 7]
+    assert query(ws, capsys, "--range", "1:1") == [(1, None, None, "first entry that fills a segment")]
+
+
+def test_segments_field_cannot_be_set(ws):
+    init(ws)
+    assert memlog.main(["set", "--workspace", ws, "--key", "segments", "--value", "3"]) == 2
+    assert "segments" not in memlog.split(read(ws))[0]
+
+
 def test_append_emits_json_ack(ws, capsys):
     init(ws)
     append(ws, "x", entry_type="idea")
@@ -0,0 +1,295 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import render_skill  # noqa: E402
+from render_skill import RenderError, render  # noqa: E402
+
+
+def age(root: Path) -> None:
+    """Backdate a tree past the racy window so stat fingerprints are trusted."""
+    old = time.time() - 3600
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (old, old), follow_symlinks=False)
+
+
+class RenderSkillTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        bmad = self.root / "_bmad"
+        self.skill = bmad / "bmm" / "sample"
+        self.skill.mkdir(parents=True)
+        (bmad / "config.toml").write_text(
+            '[core]\ncommunication_language = "English"\n', encoding="utf-8"
+        )
+        (self.skill / "workflow.md").write_text(
+            "Speak {{.communication_language}}. Next: [[bmad-snapshot:step.md]]\n",
+            encoding="utf-8",
+        )
+        (self.skill / "step.md").write_text("Step.\n", encoding="utf-8")
+        # The renderer's own files are inputs too; use copies old enough to trust.
+        scripts = bmad / "scripts"
+        scripts.mkdir()
+        for name in ("render_skill.py", "config_utils.py"):
+            shutil.copy2(Path(render_skill.__file__).with_name(name), scripts / name)
+        patcher = mock.patch.object(render_skill, "__file__", str(scripts / "render_skill.py"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        age(self.root)
+
+    def test_unchanged_inputs_reuse_the_indexed_generation(self):
+        entry = render(self.root, self.skill)
+
+        with mock.patch.object(render_skill, "_load_sources", side_effect=AssertionError):
+            self.assertEqual(render(self.root, self.skill), entry)
+
+        (self.skill / "step.md").write_text("Edited step.\n", encoding="utf-8")
+        age(self.skill)
+        edited = render(self.root, self.skill)
+        self.assertNotEqual(edited, entry)
+        self.assertEqual((edited.parent / "step.md").read_text(encoding="utf-8"), "Edited step.\n")
+
+    def test_same_named_skills_never_share_an_indexed_generation(self):
+        skills = [self.root / tool / "skills" / "demo" for tool in (".claude", ".cursor")]
+        for skill in skills:
+            skill.mkdir(parents=True)
+            (skill / "workflow.md").write_text(f"From {skill.parent.parent.name}.\n", encoding="utf-8")
+        age(self.root)
+
+        for _ in range(2):
+            for skill in skills:
+                entry = render(self.root, skill)
+                self.assertEqual(
+                    entry.read_text(encoding="utf-8"), f"From {skill.parent.parent.name}.\n"
+                )
+
+    def test_edited_output_bypasses_the_index(self):
+        entry = render(self.root, self.skill)
+        with entry.open("a", encoding="utf-8") as stream:
+            stream.write("corrupt")
+
+        with self.assertRaisesRegex(RenderError, "hash mismatch"):
+            render(self.root, self.skill)
+
+    def test_single_scan_keeps_per_kind_resolution_order(self):
+        sources = {"workflow.md": b"{{config.core.missing}} then {{.missing}} [[bmad-snapshot:step.md]]"}
+        tokens = render_skill._scan_tokens(sources)
+
+        self.assertEqual(
+            [match.lastgroup for match in tokens["workflow.md"]], ["config", "short", "snapshot"]
+        )
+        with self.assertRaisesRegex(RenderError, "missing config value `missing`"):
+            render_skill._resolve_replacements(tokens, {"core": {}}, {}, None, self.root)
+
+    def test_short_config_index_reports_ambiguity_in_document_order(self):
+        central = {"core": {"name": "a", "deep": {"name": "b"}}, "modules": {"bmm": {"name": "c"}}}
+        leaf_index = render_skill._config_leaf_index(central)
+
+        with self.assertRaisesRegex(
+            RenderError,
+            "ambiguous config value `name` found at: core.name, core.deep.name, modules.bmm.name",
+        ):
+            render_skill._resolve_short_config(leaf_index, "name", self.root)
+
+    def test_batch_renders_discovered_skills_and_reports_failures(self):
+        (self.skill / "SKILL.md").write_text("uv run render_skill.py\n", encoding="utf-8")
+        broken = self.root / ".claude" / "skills" / "broken"
+        broken.mkdir(parents=True)
+        (broken / "SKILL.md").write_text("uv run render_skill.py\n", encoding="utf-8")
+        unrelated = self.root / ".claude" / "skills" / "plain"
+        unrelated.mkdir()
+        (unrelated / "SKILL.md").write_text("No renderer.\n", encoding="utf-8")
+
+        skills = render_skill.discover_rendered_skills(self.root)
+        self.assertEqual(skills, [self.skill.resolve(), broken.resolve()])
+
+        for pool_bytes in (render_skill._POOL_SOURCE_BYTES, 0):
+            with mock.patch.object(render_skill, "_POOL_SOURCE_BYTES", pool_bytes):
+                report = render_skill.render_many(self.root, skills)
+            rendered, failed = report["skills"]
+            self.assertTrue(Path(rendered["entry"]).is_file())
+            self.assertIn("render entry is missing", failed["error"])
+
+    def test_trusted_seal_skips_rehashing_until_an_output_changes(self):
+        entry = render(self.root, self.skill, trust_seal=True)
+        destination = entry.parent
+        manifest = json.loads((destination / "manifest.json").read_text(encoding="utf-8"))
+        self.assertTrue(render_skill._seal_path(destination).is_file())
+
+        with mock.patch.object(render_skill, "_hash_file", side_effect=AssertionError):
+            render_skill._verify_existing(destination, manifest, trust_seal=True)
+
+        with entry.open("a", encoding="utf-8") as stream:
+            stream.write("corrupt")
+        with self.assertRaisesRegex(RenderError, "hash mismatch"):
+            render_skill._verify_existing(destination, manifest, trust_seal=True)
+        self.assertEqual(
+            sorted(path.name for path in destination.iterdir()),
+            ["manifest.json", "step.md", "workflow.md"],
+        )
+
+    def test_unchanged_outputs_are_shared_with_the_previous_generation(self):
+        first = render(self.root, self.skill).parent
+        (self.root / "_bmad" / "config.toml").write_text(
+            '[core]\ncommunication_language = "French"\n', encoding="utf-8"
+        )
+        second = render(self.root, self.skill).parent
+
+        self.assertNotEqual(first, second)
+        self.assertTrue((second / "step.md").samefile(first / "step.md"))
+        self.assertFalse((second / "workflow.md").samefile(first / "workflow.md"))
+
+    def test_damaged_previous_output_is_not_shared(self):
+        first = render(self.root, self.skill).parent
+        (first / "step.md").write_text("Damaged.\n", encoding="utf-8")
+        (self.root / "_bmad" / "config.toml").write_text(
+            '[core]\ncommunication_language = "French"\n', encoding="utf-8"
+        )
+        second = render(self.root, self.skill).parent
+
+        self.assertEqual((second / "step.md").read_text(encoding="utf-8"), "Step.\n")
+
+    def test_lazy_generation_renders_deferred_sources_on_request(self):
+        entry = render(self.root, self.skill, lazy=True)
+        destination = entry.parent
+        manifest = json.loads((destination / "manifest.json").read_text(encoding="utf-8"))
+        self.assertEqual(manifest["deferred"], ["step.md"])
+        self.assertFalse((destination / "step.md").exists())
+        self.assertIn(str(destination / "step.md"), entry.read_text(encoding="utf-8"))
+        self.assertNotEqual(render(self.root, self.skill).parent, destination)
+
+        step = render(self.root, self.skill, source="step.md")
+        self.assertEqual(step, destination / "step.md")
+        self.assertEqual(step.read_text(encoding="utf-8"), "Step.\n")
+        self.assertEqual(render(self.root, self.skill, lazy=True), entry)
+        self.assertEqual(render(self.root, self.skill, source="step.md"), step)
+
+        step.write_text("Tampered.\n", encoding="utf-8")
+        with self.assertRaisesRegex(RenderError, "hash mismatch"):
+            render(self.root, self.skill, source="step.md")
+        with self.assertRaisesRegex(RenderError, "not declared: other.md"):
+            render(self.root, self.skill, source="other.md")
+
+    def test_lazy_render_checks_snapshot_references_in_deferred_sources(self):
+        (self.skill / "step.md").write_text("See [[bmad-snapshot:nope.md]].\n", encoding="utf-8")
+        age(self.skill)
+
+        for lazy in (False, True):
+            with self.assertRaisesRegex(RenderError, "undeclared source: nope.md"):
+                render(self.root, self.skill, lazy=lazy)
+
+    def test_large_token_free_sources_stream_through_unchanged(self):
+        reference = "Référence line\n".encode("utf-8") * 8
+        (self.skill / "reference.md").write_bytes(reference)
+        # The token straddles a chunk boundary.
+        (self.skill / "step.md").write_bytes(b"Step text. " + b"[[bmad-snapshot:reference.md]]")
+        with (
+            mock.patch.object(render_skill, "_STREAM_MIN_BYTES", 16),
+            mock.patch.object(render_skill, "_CHUNK_BYTES", 16),
+        ):
+            sources = render_skill._load_sources(self.skill)
+            self.assertIsInstance(sources["reference.md"], render_skill._Passthrough)
+            self.assertIsInstance(sources["step.md"], bytes)
+            entry = render(self.root, self.skill)
+
+        self.assertEqual((entry.parent / "reference.md").read_bytes(), reference)
+        self.assertIn(str(entry.parent / "reference.md"), (entry.parent / "step.md").read_text())
+
+        (self.skill / "reference.md").write_bytes(b"Edited.\n")
+        with self.assertRaisesRegex(RenderError, "changed while rendering"):
+            with open(os.devnull, "wb") as sink:
+                render_skill._copy_source(sources["reference.md"], sink.fileno())
+
+    def test_sources_are_read_as_utf8_text_with_universal_newlines(self):
+        (self.skill / "workflow.md").write_bytes(b"Speak {{.communication_language}}.\r\nNext\r")
+        (self.skill / "step.md").write_bytes(b"Step.\r\n" * 8)
+        age(self.skill)
+        with mock.patch.object(render_skill, "_STREAM_MIN_BYTES", 16):
+            entry = render(self.root, self.skill)
+
+        self.assertEqual(entry.read_bytes(), b"Speak English.\nNext\n")
+        self.assertEqual((entry.parent / "step.md").read_bytes(), b"Step.\n" * 8)
+
+        (self.skill / "step.md").write_bytes(b"Step \xff.\n")
+        age(self.skill)
+        with self.assertRaisesRegex(RenderError, "failed to read render source .*step.md"):
+            render(self.root, self.skill)
+
+    def test_profile_reports_phases_and_outcome(self):
+        published, indexed = {}, {}
+        render(self.root, self.skill, profile=published)
+        render(self.root, self.skill, profile=indexed)
+
+        self.assertEqual(published["outcome"], "published")
+        self.assertEqual(
+            list(published["phases"]),
+            ["index", "load", "config", "tokens", "hash", "substitute", "publish"],
+        )
+        self.assertEqual(indexed["outcome"], "indexed")
+        self.assertEqual(list(indexed["phases"]), ["index"])
+
+        with mock.patch.object(render_skill, "_STATS_MAX_BYTES", 600):
+            for _ in range(10):
+                render_skill.record_stats(self.root, [{"skill": "sample", **indexed}])
+        lines = (self.root / "_bmad" / "render" / ".stats.jsonl").read_text().splitlines()
+        self.assertLess(len(lines), 10)
+        self.assertEqual(json.loads(lines[-1])["outcome"], "indexed")
+
+    def test_gc_keeps_recent_and_indexed_generations(self):
+        config = self.root / "_bmad" / "config.toml"
+        generations = []
+        for language in ("English", "French", "German"):
+            config.write_text(f'[core]\ncommunication_language = "{language}"\n', encoding="utf-8")
+            generations.append(render(self.root, self.skill).parent)
+        age(self.root / "_bmad" / "render")
+        # The newest by use is the first generation; the index still names the third.
+        os.utime(generations[0])
+        freed = sum(
+            (generation / name).stat().st_size
+            for generation in generations[1:2]
+            for name in ("manifest.json", "workflow.md")
+        )
+
+        report = render_skill.collect_garbage(self.root, keep=1)
+
+        self.assertEqual(report["removed"], [str(generations[1])])
+        self.assertEqual(report["kept"], 2)
+        # step.md is hardlinked into the kept generations, so deleting it frees nothing.
+        self.assertEqual(report["bytes_reclaimed"], freed)
+        self.assertFalse(generations[1].exists())
+        self.assertFalse(list(generations[0].parent.glob(".trash-*")))
+        self.assertEqual(render(self.root, self.skill).parent, generations[2])
+
+    def test_gc_touches_only_generations_of_the_named_skill(self):
+        namespace = render(self.root, self.skill).parent.parent
+        outside = self.root / "_bmad" / "bmm" / "a" / "0123456789abcdef0123"
+        outside.mkdir(parents=True)
+        (outside / "manifest.json").write_text("{}", encoding="utf-8")
+        stray = [namespace / "notes", namespace / "fedcba9876543210fedc"]
+        for path in stray:
+            path.mkdir()
+        age(self.root)
+
+        for skill in ("../bmm", str(self.skill), "*", "", ".."):
+            with self.assertRaises(RenderError):
+                render_skill.collect_garbage(self.root, keep=0, skill=skill)
+        report = render_skill.collect_garbage(self.root, keep=0, skill="sample")
+
+        self.assertEqual(report["removed"], [])  # the indexed generation is always kept
+        self.assertTrue(outside.is_dir())
+        self.assertTrue(all(path.is_dir() for path in stray))
+
+
+if __name__ == "__main__":
+    unittest.main()
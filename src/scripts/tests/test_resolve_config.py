@@ -62,6 +62,19 @@ class ResolveConfigCliTests(unittest.TestCase):
             self.assertEqual(keyed.returncode, 0, msg=keyed.stderr)
             self.assertEqual(json.loads(keyed.stdout), {"core.name": "user"})
 
+            explained = self._run(root, "--key", "core", "--explain")
+            self.assertEqual(explained.returncode, 0, msg=explained.stderr)
+            self.assertEqual(
+                json.loads(explained.stdout),
+                {
+                    "resolved": {"core": {"name": "user", "keep": "yes"}},
+                    "explain": {
+                        "core.name": str(custom.resolve() / "config.user.toml"),
+                        "core.keep": str(root.resolve() / "_bmad" / "config.toml"),
+                    },
+                },
+            )
+
     def test_malformed_present_layer_fails(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
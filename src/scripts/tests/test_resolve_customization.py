@@ -72,6 +72,77 @@ class ResolveCustomizationStdoutTests(unittest.TestCase):
             resolved = json.loads(output)
             self.assertEqual(resolved["agent"]["icon"], "🧭")
 
+    def test_batch_resolves_each_skill_keyed_by_name(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            custom = root / "_bmad" / "custom"
+            custom.mkdir(parents=True)
+            for name in ("alpha", "beta"):
+                skill = root / "_bmad" / "bmm" / name
+                skill.mkdir(parents=True)
+                (skill / "customize.toml").write_text(
+                    f'[workflow]\nname = "{name}"\nkeep = true\n', encoding="utf-8"
+                )
+            (custom / "beta.user.toml").write_text('[workflow]\nname = "mine"\n', encoding="utf-8")
+
+            skills = root / "_bmad" / "bmm"
+            repeated = self._run(
+                "--project-root",
+                str(root),
+                "--skill",
+                str(skills / "alpha"),
+                "--skill",
+                str(skills / "beta"),
+                "--key",
+                "workflow.name",
+            )
+            self.assertEqual(repeated.returncode, 0, msg=repeated.stderr)
+            self.assertEqual(
+                json.loads(repeated.stdout),
+                {"alpha": {"workflow.name": "alpha"}, "beta": {"workflow.name": "mine"}},
+            )
+
+            scanned = self._run("--project-root", str(root), "--skills-root", str(root / "_bmad"))
+            self.assertEqual(scanned.returncode, 0, msg=scanned.stderr)
+            self.assertEqual(
+                json.loads(scanned.stdout)["beta"], {"workflow": {"name": "mine", "keep": True}}
+            )
+
+    def test_batch_reports_the_failing_layer(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            custom = root / "_bmad" / "custom"
+            custom.mkdir(parents=True)
+            skill = root / "_bmad" / "bmm" / "alpha"
+            skill.mkdir(parents=True)
+            (skill / "customize.toml").write_text("[workflow]\n", encoding="utf-8")
+            (custom / "alpha.toml").write_text("[broken\n", encoding="utf-8")
+
+            result = self._run("--project-root", str(root), "--skills-root", str(root / "_bmad"))
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("failed to parse", result.stderr)
+
+    def test_missing_skills_root_is_an_error(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "_bmad").mkdir()
+
+            result = self._run("--project-root", str(root), "--skills-root", str(root / "_bmda"))
+            self.assertEqual(result.returncode, 1)
+            self.assertEqual(result.stdout, "")
+            self.assertIn("skills root is not a directory", result.stderr)
+
+    @staticmethod
+    def _run(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), *args],
+            text=True,
+            encoding="utf-8",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,144 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parents[1]
+DAEMON = SCRIPTS / "resolver_daemon.py"
+
+sys.path.insert(0, str(SCRIPTS))
+
+from resolver_daemon import Resolver, query_daemon  # noqa: E402
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix-domain sockets")
+class ResolverDaemonTests(unittest.TestCase):
+    def test_clients_use_daemon_and_see_layer_edits(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            skill = bmad / "bmm" / "sample"
+            skill.mkdir(parents=True)
+            (bmad / "config.toml").write_text('[core]\nname = "base"\n', encoding="utf-8")
+            (skill / "customize.toml").write_text('[workflow]\nname = "default"\n', encoding="utf-8")
+            daemon = self._start(root)
+            try:
+                self.assertEqual(
+                    query_daemon(root, {"op": "config", "keys": ["core.name"]}),
+                    {"ok": True, "result": {"core.name": "base"}},
+                )
+                self.assertEqual(
+                    self._json("resolve_config.py", "--project-root", str(root), "--key", "core.name"),
+                    {"core.name": "base"},
+                )
+                (bmad / "config.user.toml").write_text('[core]\nname = "user"\n', encoding="utf-8")
+                self.assertEqual(
+                    self._json("resolve_config.py", "--project-root", str(root), "--key", "core.name"),
+                    {"core.name": "user"},
+                )
+                self.assertEqual(
+                    self._json(
+                        "resolve_customization.py",
+                        "--project-root",
+                        str(root),
+                        "--skill",
+                        str(skill),
+                        "--key",
+                        "workflow.name",
+                    ),
+                    {"workflow.name": "default"},
+                )
+                (bmad / "custom").mkdir()
+                (bmad / "custom" / "config.toml").write_text("[broken\n", encoding="utf-8")
+                failed = self._run("resolve_config.py", "--project-root", str(root))
+                self.assertEqual(failed.returncode, 1)
+                self.assertIn("failed to parse", failed.stderr)
+            finally:
+                stopped = self._run("resolver_daemon.py", "stop", "--project-root", str(root))
+                daemon.wait(timeout=10)
+            self.assertEqual(stopped.returncode, 0, msg=stopped.stderr)
+            self.assertFalse((bmad / ".cache" / "resolver.sock").exists())
+
+    def test_clients_fall_back_when_socket_is_stale(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            cache = root / "_bmad" / ".cache"
+            cache.mkdir(parents=True)
+            (root / "_bmad" / "config.toml").write_text('[core]\nname = "base"\n', encoding="utf-8")
+            (cache / "resolver.sock").write_text("", encoding="utf-8")
+
+            self.assertEqual(
+                self._json("resolve_config.py", "--project-root", str(root), "--key", "core.name"),
+                {"core.name": "base"},
+            )
+
+    def test_keyed_answers_match_in_process_resolution(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            bmad = root / "_bmad"
+            skill = bmad / "bmm" / "sample"
+            skill.mkdir(parents=True)
+            bad_agents = '[core]\nname = "x"\n[[agents]]\nid = 7\n'
+            (bmad / "config.toml").write_text(bad_agents, encoding="utf-8")
+            (bmad / "config.user.toml").write_text('[[agents]]\nid = "a"\n', encoding="utf-8")
+            (skill / "customize.toml").write_text(bad_agents, encoding="utf-8")
+            custom = bmad / "custom"
+            custom.mkdir()
+            (custom / "sample.toml").write_text('[[agents]]\nid = "a"\n', encoding="utf-8")
+            resolver = Resolver(root)
+
+            for request in (
+                {"op": "config", "keys": ["core.name"]},
+                {"op": "customization", "skill": str(skill), "keys": ["core.name"]},
+            ):
+                self.assertEqual(
+                    resolver.answer(request), {"ok": True, "result": {"core.name": "x"}}
+                )
+                self.assertFalse(resolver.answer({**request, "keys": []})["ok"])
+            self.assertEqual(
+                self._json("resolve_config.py", "--project-root", str(root), "--key", "core.name"),
+                {"core.name": "x"},
+            )
+
+    def _start(self, root: Path) -> subprocess.Popen:
+        daemon = subprocess.Popen(
+            [sys.executable, str(DAEMON), "serve", "--project-root", str(root)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        # The socket file appears at bind(), before listen(); the banner
+        # follows listen().
+        if not daemon.stdout.readline().startswith("listening on "):
+            daemon.kill()
+            self.fail(f"daemon did not start: {daemon.communicate()}")
+        self.addCleanup(lambda: daemon.poll() is None and daemon.kill())
+        self.addCleanup(daemon.stdout.close)
+        self.addCleanup(daemon.stderr.close)
+        return daemon
+
+    def _json(self, script: str, *args: str):
+        result = self._run(script, *args)
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return json.loads(result.stdout)
+
+    @staticmethod
+    def _run(script: str, *args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(SCRIPTS / script), *args],
+            text=True,
+            encoding="utf-8",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+            check=False,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()